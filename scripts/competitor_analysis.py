@@ -10,6 +10,7 @@ Powered by DataForSEO APIs for professional-grade analysis:
 Usage (by Claude):
     python competitor_analysis.py "best wireless earbuds 2025"
     python competitor_analysis.py "healthy boundaries" --limit 5 --location US
+    python competitor_analysis.py --keywords-file keywords.txt --output analysis.md
 
 Manual testing:
     python competitor_analysis.py "topic" --format json
@@ -30,31 +31,201 @@ Features vs homebrew scraping:
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
+# Optional: orjson parses/serializes large API payloads several times faster
 try:
-    import requests
-    from requests.auth import HTTPBasicAuth
+    import orjson
 except ImportError:
-    print("Error: 'requests' library required. Install: pip install -r requirements.txt", file=sys.stderr)
-    sys.exit(1)
+    orjson = None
 
-# Import credential management from keyword_research
-sys.path.insert(0, str(Path(__file__).parent))
-try:
-    from keyword_research import get_api_key
-except ImportError:
-    print("Error: keyword_research.py not found. Ensure it's in the same directory.", file=sys.stderr)
-    sys.exit(1)
+# requests, requests-cache and keyword_research are imported on first use by
+# _load_dependencies(), so `--help` and plain module imports stay fast
+requests = None
+HTTPAdapter = HTTPBasicAuth = Retry = requests_cache = get_api_key = None
+HTTP_CACHE_AVAILABLE = False
+
+# DataForSEO endpoints
+SERP_API_URL = "https://api.dataforseo.com/v3/serp/google/organic/live/advanced"  # Live results
+ONPAGE_API_URL = "https://api.dataforseo.com/v3/on_page/instant_pages"
+
+# Fixed options sent with every OnPage task
+ONPAGE_TASK_OPTIONS = {
+    "enable_javascript": False,  # Faster, cheaper
+    "load_resources": False,      # Don't need CSS/images
+    "enable_browser_rendering": False  # Static analysis only
+}
+
+# Maximum number of OnPage API requests in flight at once
+MAX_CONCURRENT_REQUESTS = 10
+
+# Maximum number of URLs sent as tasks in a single OnPage API request
+ONPAGE_BATCH_SIZE = 20
+
+# Default ceiling on outbound DataForSEO requests per second
+DEFAULT_MAX_RPS = 10.0
+
+# Pages whose HEAD Content-Length exceeds this are skipped. The probe is off
+# by default (0): it sends an extra request to every competitor host
+DEFAULT_MAX_PAGE_BYTES = 0
+PAGE_SIZE_PROBE_TIMEOUT = 5  # Seconds allowed for each HEAD request
+
+# Default number of keywords analyzed at once in multi-keyword runs
+DEFAULT_KEYWORD_CONCURRENCY = 3
+
+# Cache SERP and OnPage responses (shares the keyword research cache directory)
+CACHE_DIR = Path.home() / '.dataforseo-skill' / 'cache'
+CACHE_TTL_DAYS = 7  # Rankings shift, so keep competitor data for a week
+
+# Words (3+ chars) counted when finding common H2 topics
+HEADING_WORD_PATTERN = re.compile(r'\b\w{3,}\b')
+
+
+def _load_dependencies() -> None:
+    """Import the HTTP stack and credential helpers (exits if unavailable)"""
+    global requests, HTTPAdapter, HTTPBasicAuth, Retry
+    global requests_cache, HTTP_CACHE_AVAILABLE, get_api_key
+
+    if requests is not None:
+        return
+
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from requests.auth import HTTPBasicAuth
+        from urllib3.util.retry import Retry
+    except ImportError:
+        print("Error: 'requests' library required. Install: pip install -r requirements.txt", file=sys.stderr)
+        sys.exit(1)
+
+    # Optional: requests-cache adds an HTTP-level cache that honors Cache-Control/ETag
+    try:
+        import requests_cache
+        HTTP_CACHE_AVAILABLE = True
+    except ImportError:
+        HTTP_CACHE_AVAILABLE = False
+
+    # Import credential management from keyword_research
+    sys.path.insert(0, str(Path(__file__).parent))
+    try:
+        from keyword_research import get_api_key
+    except ImportError:
+        print("Error: keyword_research.py not found. Ensure it's in the same directory.", file=sys.stderr)
+        sys.exit(1)
+
+
+def _parse_json_response(response) -> Dict:
+    """Decode an API response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _get_cache_file(kind: str, payload: Dict) -> Path:
+    """Cache file for an API request, keyed by a hash of its payload"""
+    cache_input = json.dumps(payload, sort_keys=True)
+    cache_key = hashlib.sha256(cache_input.encode()).hexdigest()
+    return CACHE_DIR / f"{kind}_{cache_key}.json"
+
+
+def _read_cache(cache_file: Path, ttl_days: int):
+    """
+    Read cached API data if available and fresh.
+
+    Returns:
+        Cached data or None if cache miss/expired/corrupted
+    """
+    try:
+        # Check freshness with the file's mtime, so expired entries are
+        # dropped without parsing them
+        try:
+            stored_at = cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        if time.time() - stored_at > ttl_days * 86400:
+            cache_file.unlink(missing_ok=True)  # Delete expired cache
+            return None
+
+        raw = cache_file.read_bytes()
+        cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return cached['data']
+
+    except (json.JSONDecodeError, KeyError, ValueError, IOError) as e:
+        # If cache is corrupted, ignore it
+        print(f"Warning: Cache read failed ({e}), will fetch fresh data", file=sys.stderr)
+        return None
+
+
+def _write_cache(cache_file: Path, data) -> None:
+    """Write API data to cache (failures are logged, not fatal)"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_data = {'timestamp': time.time(), 'data': data}
+
+        # Write to a temporary file and swap it in, so concurrent readers
+        # never see a truncated entry. The temp name is per thread because
+        # keyword and OnPage batch threads may store the same page at once
+        tmp_file = cache_file.with_suffix(f'.json.{threading.get_ident()}.tmp')
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(cache_data)
+            else:
+                payload = json.dumps(cache_data).encode('utf-8')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+    except IOError as e:
+        print(f"Warning: Could not write to cache ({e})", file=sys.stderr)
+
+
+class CompetitorAnalysisError(Exception):
+    """Raised when a keyword cannot be analyzed (e.g. no SERP results)"""
+    pass
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls to at most max_rate per second"""
+
+    def __init__(self, max_rate: float):
+        self._interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request"""
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+
+        if slot > now:
+            time.sleep(slot - now)
 
 
-@dataclass
+# Result records are immutable; __slots__ (Python 3.10+) drops the per-instance __dict__
+DATACLASS_OPTIONS = {'frozen': True, 'slots': True} if sys.version_info >= (3, 10) else {'frozen': True}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class PageStructure:
     """Analyzed structure of a competitor page (from DataForSEO OnPage API)"""
     url: str
@@ -72,12 +243,35 @@ class PageStructure:
     content_consistency: float  # Title-to-content consistency
     has_og_tags: bool  # Open Graph optimization
     has_twitter_tags: bool  # Twitter Card optimization
+    netloc: str = field(default='', repr=False, compare=False)  # Domain, derived from url
+
+    def __post_init__(self):
+        # Parse the domain once; it is shown in guidelines and every report
+        if not self.netloc:
+            object.__setattr__(self, 'netloc', urlparse(self.url).netloc)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Shallow field copy: asdict() would deep-copy headings/schema lists
+        # that are only serialized and never mutated
+        return {
+            'url': self.url,
+            'title': self.title,
+            'meta_description': self.meta_description,
+            'word_count': self.word_count,
+            'headings': self.headings,
+            'schema_types': self.schema_types,
+            'internal_links': self.internal_links,
+            'external_links': self.external_links,
+            'images': self.images,
+            'onpage_score': self.onpage_score,
+            'readability_score': self.readability_score,
+            'content_consistency': self.content_consistency,
+            'has_og_tags': self.has_og_tags,
+            'has_twitter_tags': self.has_twitter_tags
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CompetitorAnalysis:
     """Complete competitor analysis for a keyword"""
     keyword: str
@@ -89,26 +283,58 @@ class CompetitorAnalysis:
     average_seo_score: float  # Average OnPage score
     common_headings: List[str]
     common_schema: List[str]
-    writing_guidelines: Dict[str, str]  # Structured guidelines for Claude
+    writing_guidelines: Dict[str, Any]  # Structured guidelines for Claude
 
     def to_dict(self) -> Dict:
         return {
-            **asdict(self),
-            'analyzed_pages': [p.to_dict() for p in self.analyzed_pages]
+            'keyword': self.keyword,
+            'location': self.location,
+            'analyzed_pages': [p.to_dict() for p in self.analyzed_pages],
+            'average_word_count': self.average_word_count,
+            'target_word_count': self.target_word_count,
+            'average_readability': self.average_readability,
+            'average_seo_score': self.average_seo_score,
+            'common_headings': self.common_headings,
+            'common_schema': self.common_schema,
+            'writing_guidelines': self.writing_guidelines
         }
 
 
 class CompetitorAnalyzer:
     """Analyze top-ranking competitor pages for a keyword"""
 
-    def __init__(self, api_key: Optional[str] = None, interactive: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        interactive: bool = False,
+        use_cache: bool = True,
+        cache_ttl_days: int = CACHE_TTL_DAYS,
+        use_http_cache: bool = False,
+        max_rps: float = DEFAULT_MAX_RPS,
+        max_page_bytes: int = DEFAULT_MAX_PAGE_BYTES
+    ):
         """
         Initialize competitor analyzer.
 
         Args:
             api_key: DataForSEO API key (optional, uses credential management)
             interactive: Prompt for credentials if not found
+            use_cache: Reuse cached SERP/OnPage responses (default: True)
+            cache_ttl_days: Days before cached responses expire
+            use_http_cache: Opt in to also caching raw HTTP responses when
+                            requests-cache is installed (ignored when
+                            use_cache is False)
+            max_rps: Maximum DataForSEO requests per second (0 = unlimited)
+            max_page_bytes: Skip pages larger than this, per a HEAD probe
+                            of Content-Length (0 = no probe)
         """
+        _load_dependencies()
+
+        self.use_cache = use_cache
+        self.cache_ttl_days = cache_ttl_days
+        self.use_http_cache = use_cache and use_http_cache and HTTP_CACHE_AVAILABLE
+        self._rate_limiter = RateLimiter(max_rps)
+        self.max_page_bytes = max_page_bytes
         self.api_key = get_api_key(api_key, interactive=interactive)
         if not self.api_key:
             print("=" * 60, file=sys.stderr)
@@ -123,6 +349,62 @@ class CompetitorAnalyzer:
             print("=" * 60 + "\n", file=sys.stderr)
             sys.exit(1)
 
+        if ':' not in self.api_key:
+            print("=" * 60, file=sys.stderr)
+            print("ERROR: Invalid API Key Format", file=sys.stderr)
+            print("=" * 60, file=sys.stderr)
+            print("\nAPI key must be in format: 'login:password'", file=sys.stderr)
+            print("=" * 60 + "\n", file=sys.stderr)
+            sys.exit(1)
+
+        self._session = self._create_session()
+        # Competitor sites are probed with a separate, unauthenticated session
+        # so DataForSEO credentials are never sent to third-party hosts
+        self._probe_session = requests.Session() if max_page_bytes > 0 else None
+
+    def _create_session(self) -> 'requests.Session':
+        """
+        Create a pooled HTTP session for DataForSEO API calls.
+
+        Reusing one session keeps TLS connections alive across the SERP and
+        OnPage requests. Only failures where the task cannot have been run are
+        retried with backoff: connection errors and 429 rate limiting. SERP and
+        OnPage live calls are billed, so 5xx responses and read timeouts (the
+        server may already have processed the task) are never re-sent.
+        With requests-cache installed, responses are also cached at the HTTP
+        layer (SQLite, keyed by URL and request body) with conditional
+        revalidation when the server sends Cache-Control/ETag headers.
+        """
+        login, password = self.api_key.split(':', 1)
+
+        if self.use_http_cache:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            session = requests_cache.CachedSession(
+                str(CACHE_DIR / 'http_cache'),
+                backend='sqlite',
+                expire_after=timedelta(days=self.cache_ttl_days),
+                allowable_methods=('GET', 'POST'),
+                cache_control=True
+            )
+        else:
+            session = requests.Session()
+        session.auth = HTTPBasicAuth(login, password)
+        session.headers['Content-Type'] = 'application/json'
+
+        retries = Retry(
+            total=3,
+            connect=3,
+            read=0,
+            other=0,
+            backoff_factor=0.5,
+            status_forcelist=[429],
+            allowed_methods=frozenset(['POST']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        session.mount('https://', adapter)
+        return session
+
     def analyze(self, keyword: str, location: str = "United States", limit: int = 10) -> CompetitorAnalysis:
         """
         Analyze top-ranking pages for a keyword.
@@ -143,36 +425,20 @@ class CompetitorAnalyzer:
         serp_results = self._get_serp_results(keyword, location, limit)
 
         if not serp_results:
-            print("❌ No SERP results found", file=sys.stderr)
-            sys.exit(1)
+            raise CompetitorAnalysisError(f"No SERP results found for '{keyword}'")
 
         print(f"   ✓ Found {len(serp_results)} ranking pages\n", file=sys.stderr)
 
-        # Step 2: Scrape and analyze each page
+        # Step 2: Scrape and analyze each page (requests run concurrently)
         print("2️⃣  Scraping and analyzing page structures...", file=sys.stderr)
-        analyzed_pages = []
-
-        for i, result in enumerate(serp_results, 1):
-            url = result.get('url')
-            title = result.get('title', 'N/A')
-
-            print(f"   [{i}/{len(serp_results)}] {urlparse(url).netloc}", file=sys.stderr)
-
-            try:
-                page_structure = self._analyze_page(url, title, result.get('description', ''))
-                analyzed_pages.append(page_structure)
-            except Exception as e:
-                print(f"       ⚠️  Skipped ({type(e).__name__})", file=sys.stderr)
-                continue
+        analyzed_pages = self._analyze_pages(serp_results)
 
         print(f"\n   ✓ Successfully analyzed {len(analyzed_pages)}/{len(serp_results)} pages\n", file=sys.stderr)
 
         # Step 3: Aggregate insights
         print("3️⃣  Generating competitive insights...", file=sys.stderr)
 
-        avg_word_count = self._calculate_average_word_count(analyzed_pages)
-        avg_readability = self._calculate_average_readability(analyzed_pages)
-        avg_seo_score = self._calculate_average_seo_score(analyzed_pages)
+        avg_word_count, avg_readability, avg_seo_score = self._aggregate_stats(analyzed_pages)
         common_headings = self._extract_common_headings(analyzed_pages)
         common_schema = self._extract_common_schema(analyzed_pages)
 
@@ -186,7 +452,8 @@ class CompetitorAnalyzer:
         print("4️⃣  Building writing guidelines...", file=sys.stderr)
         target_word_count = int(avg_word_count * 1.2)  # 20% longer
         writing_guidelines = self._build_writing_guidelines(
-            keyword, analyzed_pages, avg_word_count, avg_readability, avg_seo_score, common_headings, common_schema
+            keyword, analyzed_pages, avg_word_count, target_word_count, avg_readability, avg_seo_score,
+            common_headings, common_schema
         )
         print("   ✓ Guidelines ready\n", file=sys.stderr)
 
@@ -203,6 +470,39 @@ class CompetitorAnalyzer:
             writing_guidelines=writing_guidelines
         )
 
+    def analyze_keywords(
+        self,
+        keywords: List[str],
+        location: str = "United States",
+        limit: int = 10,
+        concurrency: int = DEFAULT_KEYWORD_CONCURRENCY
+    ) -> List[Union[CompetitorAnalysis, Exception]]:
+        """
+        Analyze several keywords concurrently.
+
+        Each keyword runs the full analyze() pipeline; up to `concurrency`
+        keywords are in flight at once, sharing this analyzer's session,
+        cache and rate limit.
+
+        Args:
+            keywords: Target keywords to analyze
+            location: Geographic location for search results
+            limit: Number of top pages to analyze per keyword
+            concurrency: Maximum number of keywords analyzed at once
+
+        Returns:
+            One entry per keyword, in input order: a CompetitorAnalysis on
+            success, or the Exception that stopped that keyword's analysis
+        """
+        def run(keyword: str) -> Union[CompetitorAnalysis, Exception]:
+            try:
+                return self.analyze(keyword, location, limit)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            return list(executor.map(run, keywords))
+
     def _get_serp_results(self, keyword: str, location: str, limit: int) -> List[Dict]:
         """
         Get top-ranking URLs from DataForSEO SERP API.
@@ -212,12 +512,6 @@ class CompetitorAnalyzer:
         Cost: ~$0.05 per request
         """
         try:
-            # DataForSEO SERP API endpoint (live/advanced for immediate results)
-            url = "https://api.dataforseo.com/v3/serp/google/organic/live/advanced"
-
-            # Parse credentials
-            login, password = self.api_key.split(':')
-
             # Prepare request payload
             payload = [{
                 "keyword": keyword,
@@ -228,46 +522,55 @@ class CompetitorAnalyzer:
                 "depth": limit  # Number of results to return
             }]
 
-            response = requests.post(
-                url,
-                json=payload,
-                auth=HTTPBasicAuth(login, password),
-                timeout=30,
-                headers={"Content-Type": "application/json"}
-            )
+            # Check cache first
+            cache_file = _get_cache_file('serp', payload[0])
+            if self.use_cache:
+                cached_results = _read_cache(cache_file, self.cache_ttl_days)
+                if cached_results:
+                    print("   ✓ Using cached SERP results", file=sys.stderr)
+                    return cached_results
+
+            self._rate_limiter.wait()
+            response = self._session.post(SERP_API_URL, json=payload, timeout=30)
 
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json_response(response)
 
             # Parse response
-            tasks = data.get('tasks', [])
+            tasks = data.get('tasks') or []
             if not tasks:
                 return []
 
             task = tasks[0]
-            if task.get('status_code') != 20000:
-                print(f"Warning: SERP API returned status {task.get('status_code')}", file=sys.stderr)
+            status_code = task.get('status_code')
+            if status_code != 20000:
+                print(f"Warning: SERP API returned status {status_code}", file=sys.stderr)
                 return []
 
-            result = task.get('result', [])
+            result = task.get('result') or []
             if not result:
                 return []
 
             # Extract organic results
-            items = result[0].get('items', [])
+            items = result[0].get('items') or []
 
             # Filter only organic results (exclude ads, featured snippets, etc.)
             organic_results = []
             for item in items:
-                if item.get('type') == 'organic':
+                item_get = item.get
+                if item_get('type') == 'organic':
                     organic_results.append({
-                        'url': item.get('url'),
-                        'title': item.get('title'),
-                        'description': item.get('description'),
-                        'position': item.get('rank_absolute')
+                        'url': item_get('url'),
+                        'title': item_get('title'),
+                        'description': item_get('description'),
+                        'position': item_get('rank_absolute')
                     })
 
-            return organic_results[:limit]
+            organic_results = organic_results[:limit]
+            if self.use_cache and organic_results:
+                _write_cache(cache_file, organic_results)
+
+            return organic_results
 
         except requests.exceptions.RequestException as e:
             print(f"Error calling SERP API: {e}", file=sys.stderr)
@@ -276,149 +579,265 @@ class CompetitorAnalyzer:
             print(f"Error parsing SERP results: {e}", file=sys.stderr)
             return []
 
-    def _analyze_page(self, url: str, title: str, meta_desc: str) -> PageStructure:
+    def _analyze_pages(self, serp_results: List[Dict]) -> List[PageStructure]:
         """
-        Analyze a single page using DataForSEO OnPage API.
+        Analyze all SERP result pages with batched OnPage API calls.
 
-        Args:
-            url: Page URL to analyze
-            title: Page title from SERP (fallback)
-            meta_desc: Meta description from SERP (fallback)
+        URLs are grouped into batches of ONPAGE_BATCH_SIZE tasks per POST, and
+        the batches are dispatched concurrently on a thread pool.
+        Results keep their SERP order; failed pages are logged and skipped.
+        """
+        if not serp_results:
+            return []
+
+        # Serve previously analyzed URLs from cache; only fetch the rest
+        outcomes = {}
+        if self.use_cache:
+            for i, result in enumerate(serp_results):
+                cached_item = _read_cache(
+                    _get_cache_file('onpage', self._onpage_task(result.get('url'))),
+                    self.cache_ttl_days
+                )
+                if cached_item:
+                    outcomes[i] = self._parse_onpage_item(
+                        cached_item,
+                        result.get('url'),
+                        result.get('title', 'N/A'),
+                        result.get('description', '')
+                    )
+        cached_indexes = set(outcomes)
+
+        pending = [i for i in range(len(serp_results)) if i not in outcomes]
+
+        # Skip oversized pages before paying for (and waiting on) OnPage analysis
+        if pending and self._probe_session is not None:
+            workers = min(MAX_CONCURRENT_REQUESTS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sizes = list(executor.map(
+                    self._probe_page_size,
+                    [serp_results[i].get('url') for i in pending]
+                ))
+            for i, size in zip(pending, sizes):
+                if size is not None and size > self.max_page_bytes:
+                    outcomes[i] = Exception(f"Page too large ({size:,} bytes)")
+            pending = [i for i in pending if i not in outcomes]
+
+        batches = [
+            pending[i:i + ONPAGE_BATCH_SIZE]
+            for i in range(0, len(pending), ONPAGE_BATCH_SIZE)
+        ]
+
+        if batches:
+            workers = min(MAX_CONCURRENT_REQUESTS, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_outcomes = executor.map(
+                    self._analyze_pages_batch,
+                    [[serp_results[i] for i in batch] for batch in batches]
+                )
+                for batch, results in zip(batches, batch_outcomes):
+                    outcomes.update(zip(batch, results))
+
+        total = len(serp_results)
+        analyzed_pages = []
+        for i, result in enumerate(serp_results):
+            outcome = outcomes[i]
+            cached_note = " (cached)" if i in cached_indexes else ""
+            if isinstance(outcome, Exception):
+                print(f"   [{i + 1}/{total}] {urlparse(result.get('url')).netloc}", file=sys.stderr)
+                print(f"       ⚠️  Skipped ({outcome})", file=sys.stderr)
+            else:
+                print(f"   [{i + 1}/{total}] {outcome.netloc}{cached_note}", file=sys.stderr)
+                analyzed_pages.append(outcome)
+
+        return analyzed_pages
+
+    def _probe_page_size(self, url: str) -> Optional[int]:
+        """
+        Get a page's size from a HEAD request's Content-Length header.
 
         Returns:
-            PageStructure with rich metrics from OnPage API
+            Size in bytes, or None if unknown (probe failures never skip a page)
         """
         try:
-            # DataForSEO OnPage Instant Pages endpoint
-            api_url = "https://api.dataforseo.com/v3/on_page/instant_pages"
+            response = self._probe_session.head(url, timeout=PAGE_SIZE_PROBE_TIMEOUT, allow_redirects=True)
+            content_length = response.headers.get('Content-Length')
+            return int(content_length) if content_length else None
+        except (requests.exceptions.RequestException, ValueError):
+            return None
 
-            # Parse credentials
-            login, password = self.api_key.split(':')
+    def _analyze_pages_batch(self, serp_results: List[Dict]) -> List[Union[PageStructure, Exception]]:
+        """
+        Analyze several pages with a single DataForSEO OnPage API request.
 
-            # Prepare request payload
-            payload = [{
-                "url": url,
-                "enable_javascript": False,  # Faster, cheaper
-                "load_resources": False,      # Don't need CSS/images
-                "enable_browser_rendering": False  # Static analysis only
-            }]
+        Endpoint: POST /v3/on_page/instant_pages (one task per URL)
 
-            response = requests.post(
-                api_url,
-                json=payload,
-                auth=HTTPBasicAuth(login, password),
-                timeout=30,
-                headers={"Content-Type": "application/json"}
-            )
+        Args:
+            serp_results: SERP entries (url, title, description) to analyze
 
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse OnPage API response
-            tasks = data.get('tasks', [])
-            if not tasks or tasks[0].get('status_code') != 20000:
-                raise Exception(f"OnPage API error: {tasks[0].get('status_message') if tasks else 'No tasks'}")
-
-            result = tasks[0].get('result', [])
-            if not result or not result[0].get('items'):
-                raise Exception("No page data in OnPage API response")
-
-            # Extract page data
-            item = result[0]['items'][0]
-            meta = item.get('meta', {})
-            content = meta.get('content', {})
-            social_tags = meta.get('social_media_tags', {})
-
-            # Extract headings (structured from OnPage API)
-            htags = meta.get('htags', {})
-            headings = {
-                'H1': htags.get('h1', []),
-                'H2': htags.get('h2', []),
-                'H3': htags.get('h3', [])
-            }
-
-            # Infer schema types from social tags and checks
-            schema_types = []
-            if social_tags.get('og:type'):
-                schema_types.append(social_tags['og:type'])
-            if item.get('checks', {}).get('has_micromarkup'):
-                schema_types.append('Micromarkup')
-
-            # Extract metrics
-            word_count = content.get('plain_text_word_count', 0)
-            onpage_score = item.get('onpage_score', 0)
-            readability = content.get('flesch_kincaid_readability_index', 0)
-            consistency = content.get('title_to_content_consistency', 0)
-
-            # Social media optimization
-            has_og = bool(social_tags.get('og:title'))
-            has_twitter = bool(social_tags.get('twitter:card'))
-
-            return PageStructure(
-                url=url,
-                title=meta.get('title', title),
-                meta_description=meta.get('description', meta_desc),
-                word_count=word_count,
-                headings=headings,
-                schema_types=schema_types,
-                internal_links=meta.get('internal_links_count', 0),
-                external_links=meta.get('external_links_count', 0),
-                images=meta.get('images_count', 0),
-                onpage_score=onpage_score,
-                readability_score=readability,
-                content_consistency=consistency,
-                has_og_tags=has_og,
-                has_twitter_tags=has_twitter
-            )
+        Returns:
+            One entry per input, in input order: a PageStructure on success,
+            or the Exception explaining why that page could not be analyzed
+        """
+        try:
+            # Prepare request payload (one task per URL)
+            payload = [self._onpage_task(result.get('url')) for result in serp_results]
+
+            self._rate_limiter.wait()
+            response = self._session.post(ONPAGE_API_URL, json=payload, timeout=30)
 
+            response.raise_for_status()
+            data = _parse_json_response(response)
         except requests.exceptions.RequestException as e:
-            raise Exception(f"OnPage API request failed: {e}")
+            error = Exception(f"OnPage API request failed: {e}")
+            return [error] * len(serp_results)
         except Exception as e:
-            raise Exception(f"Failed to analyze page: {e}")
+            error = Exception(f"Failed to analyze page: {e}")
+            return [error] * len(serp_results)
+
+        # Match tasks back to URLs by the echoed request data,
+        # falling back to task order (which DataForSEO preserves)
+        tasks = data.get('tasks') or []
+        tasks_by_url = {}
+        for task in tasks:
+            task_url = (task.get('data') or {}).get('url')
+            if task_url:
+                tasks_by_url[task_url] = task
+
+        outcomes = []
+        for i, result in enumerate(serp_results):
+            url = result.get('url')
+            task = tasks_by_url.get(url)
+            if task is None and i < len(tasks):
+                task = tasks[i]
 
-    def _calculate_average_word_count(self, pages: List[PageStructure]) -> int:
-        """Calculate average word count across analyzed pages"""
-        if not pages:
-            return 0
-        return int(sum(p.word_count for p in pages) / len(pages))
+            try:
+                if not task or task.get('status_code') != 20000:
+                    raise Exception(f"OnPage API error: {task.get('status_message') if task else 'No tasks'}")
+
+                task_result = task.get('result') or []
+                if not task_result or not task_result[0].get('items'):
+                    raise Exception("No page data in OnPage API response")
+
+                item = task_result[0]['items'][0]
+                outcomes.append(self._parse_onpage_item(
+                    item,
+                    url,
+                    result.get('title', 'N/A'),
+                    result.get('description', '')
+                ))
+                if self.use_cache:
+                    _write_cache(_get_cache_file('onpage', payload[i]), item)
+            except Exception as e:
+                outcomes.append(Exception(f"Failed to analyze page: {e}"))
 
-    def _calculate_average_readability(self, pages: List[PageStructure]) -> float:
-        """Calculate average Flesch-Kincaid readability score"""
-        if not pages:
-            return 0.0
-        return sum(p.readability_score for p in pages) / len(pages)
+        return outcomes
+
+    def _onpage_task(self, url: str) -> Dict:
+        """Build the OnPage API task for a URL (also used as its cache key)"""
+        return {"url": url, **ONPAGE_TASK_OPTIONS}
+
+    def _parse_onpage_item(self, item: Dict, url: str, title: str, meta_desc: str) -> PageStructure:
+        """
+        Build a PageStructure from one OnPage API result item.
+
+        Args:
+            item: Page item from the OnPage API response
+            url: Page URL that was analyzed
+            title: Page title from SERP (fallback)
+            meta_desc: Meta description from SERP (fallback)
+
+        Returns:
+            PageStructure with rich metrics from OnPage API
+        """
+        # Bind each nested object once; `or {}` also covers explicit nulls
+        # without allocating a default dict per lookup
+        meta = item.get('meta') or {}
+        meta_get = meta.get
+        content = meta_get('content') or {}
+        social_tags = meta_get('social_media_tags') or {}
+        checks = item.get('checks') or {}
+
+        # Extract headings (structured from OnPage API)
+        htags = meta_get('htags') or {}
+        headings = {
+            'H1': htags.get('h1') or [],
+            'H2': htags.get('h2') or [],
+            'H3': htags.get('h3') or []
+        }
+
+        # Infer schema types from social tags and checks
+        schema_types = []
+        og_type = social_tags.get('og:type')
+        if og_type:
+            schema_types.append(og_type)
+        if checks.get('has_micromarkup'):
+            schema_types.append('Micromarkup')
+
+        # Extract metrics
+        word_count = content.get('plain_text_word_count') or 0
+        onpage_score = item.get('onpage_score') or 0
+        readability = content.get('flesch_kincaid_readability_index') or 0
+        consistency = content.get('title_to_content_consistency') or 0
+
+        # Social media optimization
+        has_og = bool(social_tags.get('og:title'))
+        has_twitter = bool(social_tags.get('twitter:card'))
+
+        return PageStructure(
+            url=url,
+            title=meta_get('title') or title,
+            meta_description=meta_get('description') or meta_desc,
+            word_count=word_count,
+            headings=headings,
+            schema_types=schema_types,
+            internal_links=meta_get('internal_links_count') or 0,
+            external_links=meta_get('external_links_count') or 0,
+            images=meta_get('images_count') or 0,
+            onpage_score=onpage_score,
+            readability_score=readability,
+            content_consistency=consistency,
+            has_og_tags=has_og,
+            has_twitter_tags=has_twitter
+        )
+
+    def _aggregate_stats(self, pages: List[PageStructure]) -> Tuple[int, float, float]:
+        """
+        Calculate average word count, readability and SEO score in one pass.
+
+        Missing (None) metrics from the OnPage API count as 0.
 
-    def _calculate_average_seo_score(self, pages: List[PageStructure]) -> float:
-        """Calculate average OnPage SEO score"""
+        Returns:
+            Tuple of (avg_word_count, avg_readability, avg_seo_score)
+        """
         if not pages:
-            return 0.0
-        return sum(p.onpage_score for p in pages) / len(pages)
+            return 0, 0.0, 0.0
 
-    def _extract_common_headings(self, pages: List[PageStructure]) -> List[str]:
-        """Extract common heading patterns across pages"""
-        all_h2s = []
+        total_words = 0
+        total_readability = 0.0
+        total_seo_score = 0.0
         for page in pages:
-            all_h2s.extend(page.headings.get('H2', []))
+            total_words += page.word_count or 0
+            total_readability += page.readability_score or 0
+            total_seo_score += page.onpage_score or 0
+
+        count = len(pages)
+        return int(total_words / count), total_readability / count, total_seo_score / count
 
+    def _extract_common_headings(self, pages: List[PageStructure]) -> List[str]:
+        """Extract common heading patterns across pages"""
         # Find patterns (simple keyword extraction)
         # This is basic - could be enhanced with NLP
-        heading_keywords = {}
-        for h2 in all_h2s:
-            # Extract key words (3+ chars)
-            words = [w.lower() for w in re.findall(r'\b\w{3,}\b', h2)]
-            for word in words:
-                heading_keywords[word] = heading_keywords.get(word, 0) + 1
+        heading_keywords = Counter()
+        for page in pages:
+            for h2 in page.headings.get('H2', ()):
+                heading_keywords.update(w.casefold() for w in HEADING_WORD_PATTERN.findall(h2))
 
         # Return top 10 common keywords
-        sorted_keywords = sorted(heading_keywords.items(), key=lambda x: x[1], reverse=True)
-        return [k for k, v in sorted_keywords[:10] if v > 1]  # Appear in 2+ headings
+        return [k for k, v in heading_keywords.most_common(10) if v > 1]  # Appear in 2+ headings
 
     def _extract_common_schema(self, pages: List[PageStructure]) -> List[str]:
         """Extract common schema types across pages"""
-        schema_counts = {}
-        for page in pages:
-            for schema_type in page.schema_types:
-                schema_counts[schema_type] = schema_counts.get(schema_type, 0) + 1
+        schema_counts = Counter(schema_type for page in pages for schema_type in page.schema_types)
 
         # Return schemas that appear in 2+ pages
         return [s for s, count in schema_counts.items() if count >= 2]
@@ -428,11 +847,12 @@ class CompetitorAnalyzer:
         keyword: str,
         pages: List[PageStructure],
         avg_word_count: int,
+        target_word_count: int,
         avg_readability: float,
         avg_seo_score: float,
         common_headings: List[str],
         common_schema: List[str]
-    ) -> Dict[str, str]:
+    ) -> Dict[str, Any]:
         """Build structured writing guidelines from competitor analysis"""
 
         # Build top competitor summary
@@ -440,7 +860,7 @@ class CompetitorAnalyzer:
         for i, page in enumerate(pages[:5], 1):
             top_competitors.append({
                 'rank': i,
-                'domain': urlparse(page.url).netloc,
+                'domain': page.netloc,
                 'title': page.title,
                 'h1': ', '.join(page.headings.get('H1', ['N/A'])),
                 'word_count': page.word_count,
@@ -451,14 +871,14 @@ class CompetitorAnalyzer:
 
         return {
             'target_keyword': keyword,
-            'target_word_count': int(avg_word_count * 1.2),
+            'target_word_count': target_word_count,
             'target_readability': f"{avg_readability:.1f} (Flesch-Kincaid)",
             'target_seo_score': f"{avg_seo_score:.1f}/100",
             'average_competitor_word_count': avg_word_count,
             'common_topics': ', '.join(common_headings[:5]) if common_headings else 'Various',
             'schema_recommendations': ', '.join(common_schema) if common_schema else 'Article, FAQPage',
             'primary_schema': common_schema[0] if common_schema else 'Article',
-            'top_5_competitors': str(top_competitors),
+            'top_5_competitors': top_competitors,
             'seo_focus': f"Use '{keyword}' in H1, introduction, and naturally throughout",
             'content_strategy': 'Go deeper than competitors with unique insights, data, and examples',
             'quality_targets': f"Match or exceed {avg_readability:.1f} readability and {avg_seo_score:.1f} SEO score"
@@ -469,6 +889,8 @@ def format_output(analysis: CompetitorAnalysis, format_type: str = "markdown") -
     """Format competitor analysis output"""
 
     if format_type == "json":
+        if orjson is not None:
+            return orjson.dumps(analysis.to_dict(), option=orjson.OPT_INDENT_2).decode('utf-8')
         return json.dumps(analysis.to_dict(), indent=2)
 
     elif format_type == "markdown":
@@ -504,20 +926,19 @@ def format_output(analysis: CompetitorAnalysis, format_type: str = "markdown") -
             "## 🏆 Top Ranking Pages\n"
         ])
 
+        # One pre-formatted block per page instead of ~11 list entries each
         for i, page in enumerate(analysis.analyzed_pages[:10], 1):
-            lines.extend([
-                f"### {i}. {urlparse(page.url).netloc}",
-                f"- **URL**: {page.url}",
-                f"- **Title**: {page.title}",
-                f"- **Word Count**: {page.word_count:,}",
-                f"- **Readability**: {page.readability_score:.1f} (Flesch-Kincaid)",
-                f"- **SEO Score**: {page.onpage_score:.1f}/100",
-                f"- **H1**: {', '.join(page.headings.get('H1', ['N/A']))}",
-                f"- **Top H2s**: {', '.join(page.headings.get('H2', [])[:3])}",
-                f"- **Schema**: {', '.join(page.schema_types) if page.schema_types else 'None'}",
-                f"- **Social**: {'✅ OG' if page.has_og_tags else '❌ OG'} | {'✅ Twitter' if page.has_twitter_tags else '❌ Twitter'}",
-                ""
-            ])
+            lines.append(f"""### {i}. {page.netloc}
+- **URL**: {page.url}
+- **Title**: {page.title}
+- **Word Count**: {page.word_count:,}
+- **Readability**: {page.readability_score:.1f} (Flesch-Kincaid)
+- **SEO Score**: {page.onpage_score:.1f}/100
+- **H1**: {', '.join(page.headings.get('H1', ['N/A']))}
+- **Top H2s**: {', '.join(page.headings.get('H2', [])[:3])}
+- **Schema**: {', '.join(page.schema_types) if page.schema_types else 'None'}
+- **Social**: {'✅ OG' if page.has_og_tags else '❌ OG'} | {'✅ Twitter' if page.has_twitter_tags else '❌ Twitter'}
+""")
 
         return "\n".join(lines)
 
@@ -525,6 +946,44 @@ def format_output(analysis: CompetitorAnalysis, format_type: str = "markdown") -
         raise ValueError(f"Unknown format: {format_type}")
 
 
+def _keyword_slug(keyword: str) -> str:
+    """Filesystem-safe slug for a keyword (used in per-keyword output names)"""
+    return re.sub(r'[^a-z0-9]+', '-', keyword.lower()).strip('-') or 'keyword'
+
+
+def _run_multiple(analyzer: CompetitorAnalyzer, keywords: List[str], args) -> None:
+    """Analyze several keywords concurrently and write or print each result"""
+    print(f"🔍 Analyzing {len(keywords)} keywords ({args.concurrency} at a time)\n", file=sys.stderr)
+    outcomes = analyzer.analyze_keywords(keywords, args.location, args.limit, args.concurrency)
+
+    outputs = []
+    failed = 0
+    for keyword, outcome in zip(keywords, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {keyword}: {outcome}", file=sys.stderr)
+            failed += 1
+            continue
+
+        output = format_output(outcome, args.format)
+        if args.output:
+            # analysis.md -> analysis.<keyword-slug>.md
+            base = Path(args.output)
+            path = base.with_name(f"{base.stem}.{_keyword_slug(keyword)}{base.suffix}")
+            path.write_text(output, encoding='utf-8')
+            print(f"✅ {keyword}: saved to {path}", file=sys.stderr)
+        else:
+            outputs.append(output)
+
+    if outputs:
+        if args.format == "json":
+            print("[\n" + ",\n".join(outputs) + "\n]")
+        else:
+            print("\n---\n\n".join(outputs))
+
+    if failed:
+        sys.exit(1)
+
+
 def main():
     """CLI interface for competitor analysis"""
     parser = argparse.ArgumentParser(
@@ -532,8 +991,20 @@ def main():
     )
     parser.add_argument(
         "keyword",
+        nargs="?",
         help="Target keyword to analyze (e.g., 'best wireless earbuds 2025')"
     )
+    parser.add_argument(
+        "--keywords-file",
+        type=Path,
+        help="File with one keyword per line to analyze in a single run"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_KEYWORD_CONCURRENCY,
+        help=f"Keywords analyzed at once with --keywords-file (default: {DEFAULT_KEYWORD_CONCURRENCY})"
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -564,27 +1035,81 @@ def main():
         "--output",
         help="Save output to file (optional)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached SERP/OnPage responses and fetch fresh data"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=CACHE_TTL_DAYS,
+        help=f"Days to reuse cached SERP/OnPage responses (default: {CACHE_TTL_DAYS})"
+    )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Also cache raw HTTP responses with requests-cache, if installed (--no-cache disables it)"
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=DEFAULT_MAX_RPS,
+        help=f"Maximum DataForSEO API requests per second, 0 for no limit (default: {DEFAULT_MAX_RPS:g})"
+    )
+    parser.add_argument(
+        "--max-page-bytes",
+        type=int,
+        default=DEFAULT_MAX_PAGE_BYTES,
+        help="Probe each page with a HEAD request and skip it if larger than this many bytes, e.g. 2097152 (default: 0, no probe)"
+    )
 
     args = parser.parse_args()
 
+    # Collect keywords (positional and/or --keywords-file)
+    keywords = [args.keyword] if args.keyword else []
+    if args.keywords_file:
+        try:
+            lines = args.keywords_file.read_text(encoding='utf-8').splitlines()
+        except OSError as e:
+            parser.error(f"cannot read --keywords-file: {e}")
+        keywords.extend(line.strip() for line in lines if line.strip())
+
+    if not keywords:
+        parser.error("provide a keyword or --keywords-file")
+
     # Initialize analyzer
-    analyzer = CompetitorAnalyzer(api_key=args.api_key, interactive=args.interactive)
+    analyzer = CompetitorAnalyzer(
+        api_key=args.api_key,
+        interactive=args.interactive,
+        use_cache=not args.no_cache,
+        cache_ttl_days=args.cache_ttl,
+        use_http_cache=args.http_cache,
+        max_rps=args.max_rps,
+        max_page_bytes=args.max_page_bytes
+    )
+
+    if len(keywords) > 1:
+        _run_multiple(analyzer, keywords, args)
+        return
 
     # Run analysis
     try:
-        analysis = analyzer.analyze(args.keyword, args.location, args.limit)
+        analysis = analyzer.analyze(keywords[0], args.location, args.limit)
 
         # Format output
         output = format_output(analysis, args.format)
 
         # Display or save
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(output)
+            Path(args.output).write_text(output, encoding='utf-8')
             print(f"\n✅ Analysis saved to: {args.output}", file=sys.stderr)
         else:
             print(output)
 
+    except CompetitorAnalysisError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"\n❌ Error: {e}", file=sys.stderr)
         import traceback
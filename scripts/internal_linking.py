@@ -16,16 +16,65 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field
+from bisect import bisect_right
 from collections import Counter
+from itertools import chain
+from urllib.parse import urlparse
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
-@dataclass
+# Markdown patterns, compiled once at import
+H1_H2_PATTERN = re.compile(r'^(#{1,2})\s+(.+)$', re.MULTILINE)
+H2_PATTERN = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+HEADING_LINE_PATTERN = re.compile(r'#{1,6}\s+.+')
+HEADING_MARKER_PATTERN = re.compile(r'#{1,6}\s+')
+LINK_PATTERN = re.compile(r'\[.+?\]\(.+?\)')
+EMPHASIS_PATTERN = re.compile(r'[*_`]')
+LINK_TARGET_PATTERN = re.compile(r'\]\(\s*([^)\s]+)')
+
+# Amount of markdown scanned for the 200-char preview before falling back
+# to the whole file
+PREVIEW_SCAN_CHARS = 4000
+
+# Below this many files, site content is parsed in-process
+PARALLEL_LOAD_MIN_FILES = 16
+
+# Parsed pages are reused while a file's mtime and size are unchanged
+CACHE_DIR = Path.home() / '.dataforseo-skill' / 'cache'
+SITE_CONTENT_CACHE_FILE = CACHE_DIR / 'site_content.json'
+# Bump whenever SiteContent extraction changes, so pages parsed by older
+# code are parsed again instead of being served from the cache
+SITE_CONTENT_CACHE_VERSION = 2
+
+
+# __slots__ (Python 3.10+) drops the per-instance __dict__
+SLOTS_OPTION = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _url_path(url: str) -> str:
+    """Path of a URL without scheme, host or trailing slash.
+
+    Page URLs are relative unless --base-url is given, while drafts often
+    link the absolute URL, so links are compared on the path alone.
+    """
+    return urlparse(url).path.rstrip('/')
+
+
+@dataclass(frozen=True, **SLOTS_OPTION)
 class InternalLinkSuggestion:
     """Internal link suggestion with context"""
     target_keyword: str  # Keyword/phrase to link
@@ -38,10 +87,19 @@ class InternalLinkSuggestion:
     reason: str  # Why this link makes sense
 
     def to_dict(self) -> Dict:
-        return asdict(self)
-
-
-@dataclass
+        return {
+            'target_keyword': self.target_keyword,
+            'target_url': self.target_url,
+            'target_title': self.target_title,
+            'anchor_text': self.anchor_text,
+            'placement_section': self.placement_section,
+            'placement_context': self.placement_context,
+            'relevance_score': self.relevance_score,
+            'reason': self.reason,
+        }
+
+
+@dataclass(**SLOTS_OPTION)
 class SiteContent:
     """Represents a page on your site"""
     url: str
@@ -49,27 +107,42 @@ class SiteContent:
     keywords: List[str]  # Main topics/keywords
     content_preview: str  # First 200 chars
     h2_headings: List[str]
+    keywords_lower: List[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Matching is case-insensitive; fold keyword case once per page
+        self.keywords_lower = [kw.lower() for kw in self.keywords]
+
+    def to_dict(self) -> Dict:
+        return {
+            'url': self.url,
+            'title': self.title,
+            'keywords': self.keywords,
+            'content_preview': self.content_preview,
+            'h2_headings': self.h2_headings,
+        }
 
     @classmethod
     def from_markdown(cls, file_path: Path, base_url: str = ""):
         """Create SiteContent from markdown file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Extract title (first H1)
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        title = title_match.group(1) if title_match else file_path.stem
-
-        # Extract H2 headings
-        h2_headings = re.findall(r'^##\s+(.+)$', content, re.MULTILINE)
+        content = file_path.read_text(encoding='utf-8')
+
+        # Extract title (first H1) and H2 headings in one pass
+        title = None
+        h2_headings = []
+        for match in H1_H2_PATTERN.finditer(content):
+            if len(match.group(1)) == 2:
+                h2_headings.append(match.group(2))
+            elif title is None:
+                title = match.group(2)
+        if title is None:
+            title = file_path.stem
 
         # Extract keywords (simplified - could use NLP)
         keywords = cls._extract_keywords(content)
 
         # Content preview
-        text = re.sub(r'#{1,6}\s+.+', '', content)  # Remove headings
-        text = re.sub(r'\[.+?\]\(.+?\)', '', text)  # Remove links
-        text = ' '.join(text.split())[:200]
+        text = cls._content_preview(content)
 
         # Generate URL from file path
         url = base_url + "/" + file_path.stem.replace('_', '-')
@@ -82,35 +155,106 @@ class SiteContent:
             h2_headings=h2_headings
         )
 
+    @staticmethod
+    def _content_preview(content: str, length: int = 200) -> str:
+        """First `length` chars of body text, without headings or links"""
+        # Headings and links sit on one line, so cleaning a prefix that ends
+        # at a line break yields a prefix of the fully cleaned text
+        if len(content) > PREVIEW_SCAN_CHARS:
+            cut = content.rfind('\n', 0, PREVIEW_SCAN_CHARS)
+            if cut != -1:
+                text = HEADING_LINE_PATTERN.sub('', content[:cut])
+                text = LINK_PATTERN.sub('', text)
+                text = ' '.join(text.split())
+                if len(text) >= length:
+                    return text[:length]
+
+        text = HEADING_LINE_PATTERN.sub('', content)  # Remove headings
+        text = LINK_PATTERN.sub('', text)  # Remove links
+        return ' '.join(text.split())[:length]
+
     @staticmethod
     def _extract_keywords(content: str) -> List[str]:
         """Extract main keywords from content (simplified)"""
         # Remove markdown formatting
-        text = re.sub(r'#{1,6}\s+', '', content)
-        text = re.sub(r'\[.+?\]\(.+?\)', '', text)
-        text = re.sub(r'[*_`]', '', text)
-
-        # Extract common phrases (2-3 words)
-        words = text.lower().split()
-        phrases = []
-
-        # Extract 2-word phrases
-        for i in range(len(words) - 1):
-            phrase = f"{words[i]} {words[i+1]}"
-            if len(phrase) > 6 and not any(c.isdigit() for c in phrase):
-                phrases.append(phrase)
-
-        # Extract 3-word phrases
-        for i in range(len(words) - 2):
-            phrase = f"{words[i]} {words[i+1]} {words[i+2]}"
-            if len(phrase) > 10 and not any(c.isdigit() for c in phrase):
-                phrases.append(phrase)
+        text = HEADING_MARKER_PATTERN.sub('', content)
+        text = LINK_PATTERN.sub('', text)
+        text = EMPHASIS_PATTERN.sub('', text)
+
+        # Extract common phrases (2-3 words). Words containing digits are
+        # blanked out so any phrase that includes one is skipped.
+        words = [
+            None if any(map(str.isdigit, word)) else word
+            for word in text.lower().split()
+        ]
+
+        # 2-word phrases longer than 6 chars
+        bigrams = (
+            f"{a} {b}"
+            for a, b in zip(words, words[1:])
+            if a and b and len(a) + len(b) + 1 > 6
+        )
+
+        # 3-word phrases longer than 10 chars
+        trigrams = (
+            f"{a} {b} {c}"
+            for a, b, c in zip(words, words[1:], words[2:])
+            if a and b and c and len(a) + len(b) + len(c) + 2 > 10
+        )
 
         # Return most common phrases
-        counter = Counter(phrases)
+        counter = Counter(chain(bigrams, trigrams))
         return [phrase for phrase, count in counter.most_common(20) if count >= 2]
 
 
+def _is_word_char(char: str) -> bool:
+    """Letters, digits and underscore, as in the regex word class"""
+    return char.isalnum() or char == '_'
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is not flanked by word characters"""
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+def _score(keyword_count: int, overlap_ratio: float, context_len: int) -> float:
+    """
+    Combine the relevance factors into a 0-100 score.
+
+    Factors:
+    - Keyword prominence (40%)
+    - Topic overlap (30%)
+    - Context quality (30%)
+    """
+    # Factor 1: Keyword prominence (40%)
+    if keyword_count >= 3:
+        score = 40.0
+    elif keyword_count == 2:
+        score = 30.0
+    elif keyword_count == 1:
+        score = 20.0
+    else:
+        score = 0.0
+
+    # Factor 2: Topic overlap (30%)
+    score += overlap_ratio * 30
+
+    # Factor 3: Context quality (30%)
+    # Prefer contexts that are descriptive (longer)
+    if context_len > 150:
+        score += 30
+    elif context_len > 100:
+        score += 20
+    else:
+        score += 10
+
+    return min(score, 100.0)
+
+
 class InternalLinkingAnalyzer:
     """Suggest internal linking opportunities"""
 
@@ -141,20 +285,55 @@ class InternalLinkingAnalyzer:
             List of InternalLinkSuggestion sorted by relevance
         """
         suggestions = []
+        min_relevance = self.min_relevance
+
+        draft_lower = draft_content.lower()
 
         # Extract sections from draft
         draft_sections = self._extract_sections(draft_content)
 
-        # For each site page, find linking opportunities
-        for page in site_pages:
+        # URLs the draft already links to
+        linked_urls = self._extract_linked_urls(draft_content)
+
+        # Index the pages using each keyword so one sweep serves them all
+        keyword_pages = {}
+        for page_index, page in enumerate(site_pages):
+            for kw in page.keywords_lower:
+                keyword_pages.setdefault(kw, []).append(page_index)
+
+        # Locate every site keyword in the draft with a single sweep
+        keyword_positions = self._find_keyword_positions(
+            draft_lower, keyword_pages.keys()
+        )
+
+        # Only pages with a keyword in the draft can get a link
+        candidate_pages = sorted({
+            page_index
+            for kw in keyword_positions
+            for page_index in keyword_pages[kw]
+        })
+
+        # For each candidate page, find linking opportunities
+        for page_index in candidate_pages:
+            page = site_pages[page_index]
+
+            # Skip if page already linked
+            if _url_path(page.url) in linked_urls:
+                continue
+
             # Find keyword matches in draft
-            matches = self._find_keyword_matches(draft_content, page.keywords)
+            matches = self._find_keyword_matches(
+                draft_content, page, keyword_positions
+            )
 
-            for keyword, contexts in matches.items():
-                # Skip if keyword already linked
-                if self._is_already_linked(draft_content, page.url):
-                    continue
+            # Topic overlap depends only on the page: share of its keywords
+            # that appear in the draft
+            overlap_count = sum(
+                1 for kw in page.keywords_lower if kw in keyword_positions
+            )
+            overlap_ratio = overlap_count / max(len(page.keywords), 1)
 
+            for keyword, contexts in matches.items():
                 # Find best placement
                 placement = self._find_best_placement(contexts, draft_sections)
 
@@ -162,14 +341,13 @@ class InternalLinkingAnalyzer:
                     section, context = placement
 
                     # Calculate relevance score
-                    relevance = self._calculate_relevance(
-                        keyword=keyword,
-                        page=page,
-                        draft_content=draft_content,
-                        context=context
+                    relevance = _score(
+                        keyword_count=len(contexts),
+                        overlap_ratio=overlap_ratio,
+                        context_len=len(context)
                     )
 
-                    if relevance >= self.min_relevance:
+                    if relevance >= min_relevance:
                         # Generate anchor text
                         anchor_text = self._generate_anchor_text(keyword, page.title)
 
@@ -186,53 +364,97 @@ class InternalLinkingAnalyzer:
                         )
                         suggestions.append(suggestion)
 
-        # Sort by relevance and limit
-        suggestions.sort(key=lambda x: x.relevance_score, reverse=True)
-        return suggestions[:max_suggestions]
+        # Top suggestions by relevance (ties keep discovery order)
+        return heapq.nlargest(
+            max_suggestions, suggestions, key=lambda x: x.relevance_score
+        )
 
-    def _extract_sections(self, content: str) -> Dict[str, str]:
-        """Extract sections (H2) from content"""
-        sections = {}
+    def _extract_sections(self, content: str) -> List[Tuple[int, str]]:
+        """
+        Extract sections (H2) from content.
 
-        # Split by H2 headings
-        parts = re.split(r'^##\s+(.+)$', content, flags=re.MULTILINE)
+        Returns:
+            List of (start offset, heading) in document order. Each section
+            runs from its heading line to the start of the next one.
+        """
+        return [
+            (match.start(), match.group(1).strip())
+            for match in H2_PATTERN.finditer(content)
+        ]
 
-        # Group heading with its content
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                heading = parts[i].strip()
-                section_content = parts[i + 1].strip()
-                sections[heading] = section_content
+    def _find_keyword_positions(
+        self,
+        content_lower: str,
+        keywords: Iterable[str]
+    ) -> Dict[str, List[int]]:
+        """
+        Find start positions of every keyword in lowercased content.
+
+        Uses a single Aho-Corasick sweep when pyahocorasick is installed,
+        otherwise falls back to one regex scan per keyword. Only whole-word
+        matches count, so "seo" does not match inside "seoul". Matches of
+        the same keyword never overlap.
+
+        Args:
+            content_lower: Lowercased content to search
+            keywords: Unique lowercased keywords
 
-        return sections
+        Returns:
+            Dict of lowercased keyword -> list of start positions
+        """
+        positions = {}
+
+        if AHOCORASICK_AVAILABLE and keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+
+            next_start = {}
+            for end, keyword in automaton.iter(content_lower):
+                pos = end - len(keyword) + 1
+                if (pos >= next_start.get(keyword, 0)
+                        and _is_whole_word(content_lower, pos, end + 1)):
+                    positions.setdefault(keyword, []).append(pos)
+                    next_start[keyword] = end + 1
+
+            return positions
+
+        for keyword in keywords:
+            # Most site keywords never occur in the draft; a plain substring
+            # test rules them out without compiling a pattern
+            if keyword not in content_lower:
+                continue
+
+            # Lookarounds reject hits inside longer words, like _is_whole_word
+            pattern = re.compile(r'(?<!\w)' + re.escape(keyword) + r'(?!\w)')
+            found = [match.start() for match in pattern.finditer(content_lower)]
+            if found:
+                positions[keyword] = found
+
+        return positions
 
     def _find_keyword_matches(
         self,
         content: str,
-        keywords: List[str]
-    ) -> Dict[str, List[str]]:
+        page: SiteContent,
+        keyword_positions: Dict[str, List[int]]
+    ) -> Dict[str, List[Tuple[int, str]]]:
         """
         Find keyword mentions in content with context.
 
+        Args:
+            content: Draft content
+            page: Site page whose keywords to look up
+            keyword_positions: Output of _find_keyword_positions for content
+
         Returns:
-            Dict of keyword -> list of context snippets
+            Dict of keyword -> list of (position, context snippet)
         """
         matches = {}
 
-        content_lower = content.lower()
-
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-
-            # Find all occurrences
-            positions = []
-            start = 0
-            while True:
-                pos = content_lower.find(keyword_lower, start)
-                if pos == -1:
-                    break
-                positions.append(pos)
-                start = pos + len(keyword_lower)
+        for keyword, keyword_lower in zip(page.keywords, page.keywords_lower):
+            positions = keyword_positions.get(keyword_lower)
 
             if positions:
                 # Extract context around each match
@@ -242,84 +464,45 @@ class InternalLinkingAnalyzer:
                     context_start = max(0, pos - 100)
                     context_end = min(len(content), pos + len(keyword) + 100)
                     context = content[context_start:context_end].strip()
-                    contexts.append(context)
+                    contexts.append((pos, context))
 
                 matches[keyword] = contexts
 
         return matches
 
-    def _is_already_linked(self, content: str, url: str) -> bool:
-        """Check if URL is already linked in content"""
-        return url in content
+    def _extract_linked_urls(self, content: str) -> Set[str]:
+        """Collect the paths of markdown link targets in content"""
+        return {_url_path(url) for url in LINK_TARGET_PATTERN.findall(content)}
 
     def _find_best_placement(
         self,
-        contexts: List[str],
-        sections: Dict[str, str]
+        contexts: List[Tuple[int, str]],
+        sections: List[Tuple[int, str]]
     ) -> Optional[Tuple[str, str]]:
         """
         Find best section for link placement.
 
+        Args:
+            contexts: (position, context) pairs in document order
+            sections: Output of _extract_sections for the same content
+
         Returns:
             Tuple of (section_heading, context) or None
         """
+        section_starts = [start for start, _ in sections]
+
         # Find which section contains the first mention
-        for section_heading, section_content in sections.items():
-            for context in contexts:
-                # Check if context appears in this section
-                if context in section_content:
-                    return (section_heading, context)
+        for pos, context in contexts:
+            index = bisect_right(section_starts, pos) - 1
+            if index >= 0:
+                return (sections[index][1], context)
 
-        # Fallback: return first context with generic section
+        # Fallback: mentions only appear before the first H2
         if contexts:
-            return ("Introduction", contexts[0])
+            return ("Introduction", contexts[0][1])
 
         return None
 
-    def _calculate_relevance(
-        self,
-        keyword: str,
-        page: SiteContent,
-        draft_content: str,
-        context: str
-    ) -> float:
-        """
-        Calculate relevance score (0-100) for link suggestion.
-
-        Factors:
-        - Keyword prominence (40%)
-        - Topic overlap (30%)
-        - Context quality (30%)
-        """
-        score = 0.0
-
-        # Factor 1: Keyword prominence (40%)
-        keyword_count = draft_content.lower().count(keyword.lower())
-        if keyword_count >= 3:
-            score += 40
-        elif keyword_count == 2:
-            score += 30
-        elif keyword_count == 1:
-            score += 20
-
-        # Factor 2: Topic overlap (30%)
-        # Check if page keywords appear in draft
-        draft_lower = draft_content.lower()
-        overlap_count = sum(1 for kw in page.keywords if kw.lower() in draft_lower)
-        overlap_ratio = overlap_count / max(len(page.keywords), 1)
-        score += overlap_ratio * 30
-
-        # Factor 3: Context quality (30%)
-        # Prefer contexts that are descriptive (longer)
-        if len(context) > 150:
-            score += 30
-        elif len(context) > 100:
-            score += 20
-        else:
-            score += 10
-
-        return min(score, 100.0)
-
     def _generate_anchor_text(self, keyword: str, page_title: str) -> str:
         """Generate optimal anchor text"""
         # Prefer natural keyword as anchor
@@ -346,26 +529,126 @@ class InternalLinkingAnalyzer:
             return f"Moderate relevance: Related topic that adds value"
 
 
+def _parse_markdown_file(
+    file_path: Path,
+    base_url: str = ""
+) -> Union[SiteContent, Exception]:
+    """Parse one markdown file, returning the exception instead of raising"""
+    try:
+        return SiteContent.from_markdown(file_path, base_url)
+    except Exception as e:
+        return e
+
+
+def _read_site_content_cache() -> Dict:
+    """Load cached pages, ignoring a missing, corrupt or outdated cache file"""
+    try:
+        with open(SITE_CONTENT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != SITE_CONTENT_CACHE_VERSION:
+        return {}
+    pages = cache.get('pages')
+    return pages if isinstance(pages, dict) else {}
+
+
+def _write_site_content_cache(pages: Dict):
+    """Persist cached pages (written to a temp file and swapped in)"""
+    tmp_file = SITE_CONTENT_CACHE_FILE.with_suffix('.json.tmp')
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': SITE_CONTENT_CACHE_VERSION, 'pages': pages}, f)
+            os.replace(tmp_file, SITE_CONTENT_CACHE_FILE)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+    except Exception as e:
+        print(f"Warning: Could not write to cache ({e})", file=sys.stderr)
+
+
 def load_site_content(
     content_paths: List[Path],
-    base_url: str = ""
+    base_url: str = "",
+    use_cache: bool = True
 ) -> List[SiteContent]:
-    """Load site content from markdown files"""
-    site_pages = []
-
+    """
+    Load site content from markdown files.
+
+    Args:
+        content_paths: Markdown files or directories to search recursively
+        base_url: Base URL prepended to each page slug
+        use_cache: Reuse pages parsed by earlier runs when the file's
+            mtime and size are unchanged
+
+    Returns:
+        List of SiteContent in path order
+    """
+    # Expand directories up front so files can be parsed in parallel
+    md_paths = []
     for path in content_paths:
         try:
             if path.is_file() and path.suffix == '.md':
-                page = SiteContent.from_markdown(path, base_url)
-                site_pages.append(page)
+                md_paths.append(path)
             elif path.is_dir():
                 # Recursively load all .md files
-                for md_file in path.rglob('*.md'):
-                    page = SiteContent.from_markdown(md_file, base_url)
-                    site_pages.append(page)
+                md_paths.extend(path.rglob('*.md'))
         except Exception as e:
             print(f"Warning: Failed to load {path}: {e}", file=sys.stderr)
 
+    cache = _read_site_content_cache() if use_cache else {}
+    # Rebuilt from the files loaded now, so deleted files drop out of the cache
+    pages = {}
+    results = [None] * len(md_paths)
+    stale = []  # (index, cache key, signature) of files that need parsing
+
+    for index, path in enumerate(md_paths):
+        try:
+            stat = path.stat()
+            key = str(path.resolve())
+        except OSError as e:
+            results[index] = e
+            continue
+
+        signature = [stat.st_mtime_ns, stat.st_size, base_url]
+        entry = cache.get(key)
+        if entry and entry.get('signature') == signature:
+            try:
+                results[index] = SiteContent(**entry['page'])
+                pages[key] = entry
+                continue
+            except (KeyError, TypeError):
+                pass  # Corrupt entry, parse again
+        stale.append((index, key, signature))
+
+    parse = partial(_parse_markdown_file, base_url=base_url)
+    stale_paths = [md_paths[index] for index, _, _ in stale]
+
+    # Process start-up costs more than it saves on small sites
+    if len(stale_paths) < PARALLEL_LOAD_MIN_FILES:
+        parsed = list(map(parse, stale_paths))
+    else:
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(parse, stale_paths, chunksize=8))
+
+    for (index, key, signature), result in zip(stale, parsed):
+        results[index] = result
+        if use_cache and not isinstance(result, Exception):
+            pages[key] = {'signature': signature, 'page': result.to_dict()}
+
+    # Without stale files, pages is a subset of cache; a size change means pruning
+    if use_cache and (stale or len(pages) != len(cache)):
+        _write_site_content_cache(pages)
+
+    site_pages = []
+    for path, result in zip(md_paths, results):
+        if isinstance(result, Exception):
+            print(f"Warning: Failed to load {path}: {result}", file=sys.stderr)
+        else:
+            site_pages.append(result)
+
     return site_pages
 
 
@@ -448,6 +731,11 @@ def main():
         default="markdown",
         help="Output format (default: markdown)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Reparse every site file instead of reusing cached pages"
+    )
 
     args = parser.parse_args()
 
@@ -470,7 +758,11 @@ def main():
         print("Example: --site-content blog/*.md", file=sys.stderr)
         sys.exit(1)
 
-    site_pages = load_site_content(args.site_content, args.base_url)
+    site_pages = load_site_content(
+        args.site_content,
+        args.base_url,
+        use_cache=not args.no_cache
+    )
 
     if not site_pages:
         print("Error: No site content loaded. Check paths.", file=sys.stderr)
@@ -28,22 +28,71 @@ See scripts/CREDENTIALS.md for details.
 
 import argparse
 import base64
+import functools
 import hashlib
 import json
 import os
+import re
 import sys
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, fields
 try:
     import getpass
 except ImportError:
     getpass = None
 
+# Optional: orjson parses API responses and cache files several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Cache configuration
 CACHE_DIR = Path.home() / '.dataforseo-skill' / 'cache'
 CACHE_TTL_DAYS = 30  # Cache keyword research for 30 days
+MEMORY_CACHE_SIZE = 256  # Results kept in memory per KeywordResearcher
+
+# Characters strict Base64 decoding accepts (alphabet plus padding)
+BASE64_PATTERN = re.compile(r'[A-Za-z0-9+/=]+')
+
+# Fields of a search volume result used for scoring, and the difficulty
+# assigned to each competition level when competition_index is missing
+RESULT_FIELDS = ('keyword', 'search_volume', 'competition', 'competition_index', 'cpc')
+COMPETITION_SCORES = {
+    'HIGH': 75,
+    'MEDIUM': 50,
+    'LOW': 25
+}
+
+# Keyword variation patterns, original topic first
+VARIATION_TEMPLATES = (
+    "{topic}",
+    # Common prefixes
+    "best {topic}",
+    "how to {topic}",
+    "what is {topic}",
+    "guide to {topic}",
+    "tips for {topic}",
+    # Common suffixes
+    "{topic} guide",
+    "{topic} tips",
+    "{topic} for beginners",
+    "{topic} explained",
+    "{topic} 2024",
+    # Combined
+    "best {topic} tips",
+    "how to {topic}",
+)
+
+# Question formats offered as related keywords in fallback mode
+RELATED_TEMPLATES = (
+    "what is {topic}",
+    "how to {topic}",
+    "why {topic}",
+)
 
 
 class KeywordResearchError(Exception):
@@ -51,17 +100,46 @@ class KeywordResearchError(Exception):
     pass
 
 
-@dataclass
+# __slots__ (Python 3.10+) drops the per-instance __dict__
+SLOTS_OPTION = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **SLOTS_OPTION)
 class KeywordData:
-    """Structured keyword research data"""
+    """Structured keyword research data (immutable: cached results are shared)"""
     keyword: str
     search_volume: int
     keyword_difficulty: int
-    related_keywords: List[str]
+    related_keywords: Tuple[str, ...]  # Lists are converted to a tuple
     relevance_score: float  # 0-100
     
+    def __post_init__(self):
+        # A tuple keeps instances shared through the caches fully immutable
+        if not isinstance(self.related_keywords, tuple):
+            object.__setattr__(self, 'related_keywords', tuple(self.related_keywords))
+    
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Built by hand; asdict() recurses into every field
+        return {
+            'keyword': self.keyword,
+            'search_volume': self.search_volume,
+            'keyword_difficulty': self.keyword_difficulty,
+            'related_keywords': list(self.related_keywords),
+            'relevance_score': self.relevance_score,
+        }
+
+
+# KeywordData constructor argument order, for rebuilding cached results
+KEYWORD_DATA_FIELDS = tuple(f.name for f in fields(KeywordData))
+
+# One keyword entry in markdown output (followed by a blank line)
+MARKDOWN_ROW_TEMPLATE = (
+    "## {index}. {keyword}\n"
+    "- **Search Volume:** {volume:,}\n"
+    "- **Difficulty:** {difficulty}/100\n"
+    "- **Relevance:** {relevance:.1f}/100\n"
+    "{related}"
+)
 
 
 def decode_base64_credentials(encoded: str) -> Optional[str]:
@@ -82,6 +160,14 @@ def decode_base64_credentials(encoded: str) -> Optional[str]:
     
     encoded = encoded.strip()
     
+    # Plain login:password can't be Base64 (':' is outside the alphabet),
+    # unpadded Base64 must be a multiple of 4 characters long, and anything
+    # else outside the alphabet would only make the strict decode raise
+    if ':' in encoded or (len(encoded) % 4 and '=' not in encoded):
+        return encoded
+    if not BASE64_PATTERN.fullmatch(encoded):
+        return encoded
+    
     # Try to decode Base64
     try:
         decoded_bytes = base64.b64decode(encoded, validate=True)
@@ -99,6 +185,11 @@ def decode_base64_credentials(encoded: str) -> Optional[str]:
         return encoded
 
 
+def _result_fields(item: Dict) -> tuple:
+    """Read RESULT_FIELDS from an API result in one pass (None if missing)"""
+    return tuple(map(item.get, RESULT_FIELDS))
+
+
 def _ensure_cache_dir():
     """Create cache directory if it doesn't exist"""
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -107,7 +198,7 @@ def _ensure_cache_dir():
 def _get_cache_key(topic: str, limit: int) -> str:
     """Generate cache key from topic and limit"""
     cache_input = f"{topic.lower().strip()}_{limit}"
-    return hashlib.md5(cache_input.encode()).hexdigest()
+    return hashlib.blake2b(cache_input.encode(), digest_size=16).hexdigest()
 
 
 def get_cached_keywords(topic: str, limit: int) -> Optional[List['KeywordData']]:
@@ -121,34 +212,49 @@ def get_cached_keywords(topic: str, limit: int) -> Optional[List['KeywordData']]
     Returns:
         Cached KeywordData list or None if cache miss/expired
     """
+    entry = _read_cache_entry(topic, limit)
+    return entry[1] if entry else None
+
+
+def _read_cache_entry(topic: str, limit: int) -> Optional[Tuple[float, List['KeywordData']]]:
+    """
+    Load a fresh disk cache entry along with the time it was written.
+
+    Returns:
+        (stored_at, keywords) or None if cache miss/expired
+    """
     try:
         _ensure_cache_dir()
         cache_key = _get_cache_key(topic, limit)
         cache_file = CACHE_DIR / f"{cache_key}.json"
 
-        if not cache_file.exists():
+        # Check if cache is still valid using the file's mtime, so expired
+        # entries are dropped without parsing them
+        try:
+            stored_at = cache_file.stat().st_mtime
+        except FileNotFoundError:
             return None
+        cache_age = time.time() - stored_at
 
-        # Load cached data
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Check if cache is still valid
-        cached_at = datetime.fromisoformat(data['timestamp'])
-        cache_age = datetime.now() - cached_at
-
-        if cache_age > timedelta(days=CACHE_TTL_DAYS):
+        if cache_age > CACHE_TTL_DAYS * 86400:
             # Cache expired
             cache_file.unlink()  # Delete expired cache
             return None
 
-        # Reconstruct KeywordData objects
-        keywords = [KeywordData(**kw) for kw in data['keywords']]
+        # Load cached data
+        raw = cache_file.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        # Reconstruct KeywordData objects (positional args skip kwargs binding)
+        keywords = [
+            KeywordData(*[kw[name] for name in KEYWORD_DATA_FIELDS])
+            for kw in data['keywords']
+        ]
 
         # Print cache hit info to stderr (not interfering with output)
-        print(f"✓ Cache hit for '{topic}' (age: {cache_age.days} days)", file=sys.stderr)
+        print(f"✓ Cache hit for '{topic}' (age: {int(cache_age // 86400)} days)", file=sys.stderr)
 
-        return keywords
+        return stored_at, keywords
 
     except (json.JSONDecodeError, KeyError, ValueError, IOError) as e:
         # If cache is corrupted, ignore it
@@ -172,15 +278,25 @@ def save_keywords_to_cache(topic: str, limit: int, keywords: List['KeywordData']
 
         # Prepare cache data
         cache_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'topic': topic,
             'limit': limit,
             'keywords': [kw.to_dict() for kw in keywords]
         }
 
-        # Write to cache
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2)
+        # Write to a temporary file and swap it in, so an interrupted write
+        # never leaves a truncated cache entry behind
+        tmp_file = cache_file.with_suffix(cache_file.suffix + '.tmp')
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(cache_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(cache_data, indent=2).encode('utf-8')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
         print(f"✓ Cached results for '{topic}'", file=sys.stderr)
 
@@ -215,22 +331,10 @@ def get_api_key(api_key: Optional[str] = None, interactive: bool = False) -> Opt
     if api_key:
         return decode_base64_credentials(api_key)
     
-    # Method 2: Environment variable
-    api_key = os.getenv('DATAFORSEO_API_KEY')
+    # Methods 2-3: Environment variable, then config file (memoized)
+    api_key = _resolve_stored_api_key(os.getenv('DATAFORSEO_API_KEY'))
     if api_key:
-        return decode_base64_credentials(api_key)
-    
-    # Method 3: Config file
-    config_path = Path.home() / '.dataforseo-skill' / 'config.json'
-    if config_path.exists():
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                api_key = config.get('api_key')
-                if api_key:
-                    return decode_base64_credentials(api_key)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Could not read config file ({e})", file=sys.stderr)
+        return api_key
     
     # Method 4: Interactive prompt (if enabled and available)
     if interactive and getpass:
@@ -249,19 +353,99 @@ def get_api_key(api_key: Optional[str] = None, interactive: bool = False) -> Opt
     return None
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_stored_api_key(env_api_key: Optional[str]) -> Optional[str]:
+    """
+    Resolve credentials from the environment variable or the config file.
+
+    Memoized on the environment value, so repeated lookups in one process
+    don't re-read the config file. Call reset_api_key_cache() after the
+    config file changes.
+
+    Args:
+        env_api_key: Current value of DATAFORSEO_API_KEY (or None)
+
+    Returns:
+        API key string in login:password format, or None if not found
+    """
+    # Method 2: Environment variable
+    if env_api_key:
+        return decode_base64_credentials(env_api_key)
+    
+    # Method 3: Config file
+    config_path = Path.home() / '.dataforseo-skill' / 'config.json'
+    if config_path.exists():
+        try:
+            with open(config_path, 'r') as f:
+                config = json.load(f)
+                api_key = config.get('api_key')
+                if api_key:
+                    return decode_base64_credentials(api_key)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not read config file ({e})", file=sys.stderr)
+    
+    return None
+
+
+def reset_api_key_cache():
+    """Forget memoized credentials so the next get_api_key() re-reads them"""
+    _resolve_stored_api_key.cache_clear()
+
+
 class KeywordResearcher:
     """Keyword research with DataForSEO API integration"""
     
-    def __init__(self, api_key: Optional[str] = None, interactive: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        interactive: bool = False,
+        use_cache: bool = True
+    ):
         """
         Initialize keyword researcher with hybrid credential management.
         
         Args:
             api_key: Explicitly provided API key (optional)
             interactive: Whether to prompt for credentials if not found (default: False)
+            use_cache: Reuse cached research results (default: True)
         """
+        self.use_cache = use_cache
         self.api_key = get_api_key(api_key, interactive=interactive)
         self.api_available = bool(self.api_key)
+
+        # Split credentials once (format: "login:password")
+        self._login = self._password = None
+        if self.api_available:
+            if ':' in self.api_key:
+                self._login, self._password = self.api_key.split(':', 1)
+            else:
+                print("=" * 60, file=sys.stderr)
+                print("ERROR: Invalid API Key Format", file=sys.stderr)
+                print("=" * 60, file=sys.stderr)
+                print("\nAPI key must be in format: 'login:password'", file=sys.stderr)
+                print("\nExamples of correct format:", file=sys.stderr)
+                print("  user@example.com:mypassword123", file=sys.stderr)
+                print("  username:SecureP@ssw0rd", file=sys.stderr)
+                print("\nFalling back to heuristic mode.", file=sys.stderr)
+                print("=" * 60 + "\n", file=sys.stderr)
+                self.api_available = False
+
+        # requests is only needed for API calls; bind it once here. If it is
+        # missing, _api_research reports that and falls back to heuristics.
+        self._requests = None
+        if self.api_available:
+            try:
+                import requests
+                self._requests = requests
+            except ImportError:
+                pass
+
+        # Pooled HTTP session, created on the first API call
+        self._session = None
+
+        # In-process LRU in front of the disk cache:
+        # (topic, limit) -> (stored_at, keywords)
+        self._memory_cache = OrderedDict()
         
     def research_keywords(self, topic: str, limit: int = 5) -> List[KeywordData]:
         """
@@ -274,10 +458,21 @@ class KeywordResearcher:
         Returns:
             List of KeywordData objects sorted by relevance score
         """
-        # Check cache first
-        cached_results = get_cached_keywords(topic, limit)
-        if cached_results:
-            return cached_results
+        memory_key = (topic.lower().strip(), limit)
+        if self.use_cache:
+            # Repeated queries in this process skip the disk cache entirely
+            entry = self._memory_cache.get(memory_key)
+            if entry and time.time() - entry[0] < CACHE_TTL_DAYS * 86400:
+                self._memory_cache.move_to_end(memory_key)
+                return list(entry[1])
+
+            # Check cache first; the memory entry keeps the disk entry's age
+            # so it expires with it instead of living another full TTL
+            cached = _read_cache_entry(topic, limit)
+            if cached and cached[1]:
+                stored_at, cached_results = cached
+                self._remember(memory_key, cached_results, stored_at)
+                return cached_results
 
         # Cache miss - fetch fresh data
         if self.api_available:
@@ -286,10 +481,33 @@ class KeywordResearcher:
             keywords = self._fallback_research(topic, limit)
 
         # Save to cache for future use
-        if keywords:
+        if keywords and self.use_cache:
             save_keywords_to_cache(topic, limit, keywords)
+            self._remember(memory_key, keywords)
 
         return keywords
+
+    def _remember(
+        self,
+        memory_key: Tuple[str, int],
+        keywords: List[KeywordData],
+        stored_at: Optional[float] = None
+    ):
+        """
+        Store results in the in-process cache, evicting the oldest entry.
+
+        Args:
+            memory_key: (normalized topic, limit)
+            keywords: Results to remember
+            stored_at: When the results were fetched (default: now); the
+                entry expires CACHE_TTL_DAYS after this
+        """
+        if stored_at is None:
+            stored_at = time.time()
+        self._memory_cache[memory_key] = (stored_at, list(keywords))
+        self._memory_cache.move_to_end(memory_key)
+        if len(self._memory_cache) > MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
     
     def _api_research(self, topic: str, limit: int) -> List[KeywordData]:
         """
@@ -299,15 +517,14 @@ class KeywordResearcher:
         API Documentation: https://docs.dataforseo.com/v3/keywords_data/google_ads/search_volume/live
         """
         try:
-            # Import requests only if API is available
-            import requests
-            from requests.auth import HTTPBasicAuth
+            requests = self._requests
+            if requests is None:
+                raise ImportError("No module named 'requests'")
 
             # DataForSEO API endpoint - Live endpoint returns immediate results
             url = "https://api.dataforseo.com/v3/keywords_data/google_ads/search_volume/live"
 
-            # Parse credentials (format: "login:password")
-            login, password = self.api_key.split(':')
+            session = self._get_session()
 
             # Generate keyword variations to get metrics for multiple options
             variations = self._generate_variations(topic)
@@ -322,18 +539,12 @@ class KeywordResearcher:
                 # Note: search_partners, date_from, date_to are not valid for /live endpoint
             }]
             
-            response = requests.post(
-                url,
-                json=payload,
-                auth=HTTPBasicAuth(login, password),
-                timeout=30,
-                headers={
-                    "Content-Type": "application/json"
-                }
-            )
+            body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+
+            response = session.post(url, data=body, timeout=30)
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
             
             # Debug: Print response structure (can be disabled)
             if os.getenv('DEBUG_API_RESPONSE'):
@@ -447,19 +658,7 @@ class KeywordResearcher:
             print("=" * 60 + "\n", file=sys.stderr)
             return self._fallback_research(topic, limit)
         except ValueError as e:
-            if "split" in str(e) or ":" in str(e):
-                print("=" * 60, file=sys.stderr)
-                print("ERROR: Invalid API Key Format", file=sys.stderr)
-                print("=" * 60, file=sys.stderr)
-                print("\nAPI key must be in format: 'login:password'", file=sys.stderr)
-                print(f"Error details: {e}", file=sys.stderr)
-                print("\nExamples of correct format:", file=sys.stderr)
-                print("  user@example.com:mypassword123", file=sys.stderr)
-                print("  username:SecureP@ssw0rd", file=sys.stderr)
-                print("\nFalling back to heuristic mode.", file=sys.stderr)
-                print("=" * 60 + "\n", file=sys.stderr)
-            else:
-                print(f"Warning: Value error ({e}). Using fallback.", file=sys.stderr)
+            print(f"Warning: Value error ({e}). Using fallback.", file=sys.stderr)
             return self._fallback_research(topic, limit)
         except Exception as e:
             print("=" * 60, file=sys.stderr)
@@ -471,6 +670,27 @@ class KeywordResearcher:
             print("=" * 60 + "\n", file=sys.stderr)
             return self._fallback_research(topic, limit)
     
+    def _get_session(self) -> 'requests.Session':
+        """
+        Return the pooled HTTP session for DataForSEO API calls.
+
+        The session is created on first use and reused afterwards, so repeated
+        research calls keep their TLS connection alive.
+        """
+        if self._session is None:
+            requests = self._requests
+
+            session = requests.Session()
+            session.auth = requests.auth.HTTPBasicAuth(self._login, self._password)
+            session.headers['Content-Type'] = 'application/json'
+            session.mount(
+                'https://',
+                requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            )
+            self._session = session
+
+        return self._session
+
     def _parse_api_response(self, data: Dict, topic: str, limit: int) -> List[KeywordData]:
         """
         Parse DataForSEO API response into KeywordData objects
@@ -515,6 +735,8 @@ class KeywordResearcher:
                 print(f"Warning: No tasks found in API response", file=sys.stderr)
                 return keywords
             
+            topic_lower = topic.lower()
+
             for task in tasks:
                 # Check task-level status (20000 = success)
                 task_status = task.get('status_code')
@@ -546,12 +768,20 @@ class KeywordResearcher:
                     if not item or not isinstance(item, dict):
                         continue
                     
+                    # Read the scored fields once and share them between
+                    # difficulty and relevance
+                    keyword, volume, competition, competition_index, cpc = _result_fields(item)
+                    volume = volume or 0
+                    difficulty = self._difficulty_from_fields(competition_index, competition, cpc)
+
                     keyword_data = KeywordData(
-                        keyword=item.get('keyword', topic),
-                        search_volume=item.get('search_volume') or 0,
-                        keyword_difficulty=self._calculate_difficulty(item),
+                        keyword=keyword if keyword is not None else topic,
+                        search_volume=volume,
+                        keyword_difficulty=difficulty,
                         related_keywords=self._extract_related(item),
-                        relevance_score=self._calculate_relevance(item, topic)
+                        relevance_score=self._relevance_from_fields(
+                            keyword or '', volume, difficulty, topic_lower
+                        )
                     )
                     keywords.append(keyword_data)
                 
@@ -575,26 +805,22 @@ class KeywordResearcher:
         Uses competition_index (0-100) if available, otherwise falls back to
         competition string (HIGH/MEDIUM/LOW) and CPC.
         """
+        _, _, competition, competition_index, cpc = _result_fields(item)
+        return self._difficulty_from_fields(competition_index, competition, cpc)
+
+    @staticmethod
+    def _difficulty_from_fields(competition_index, competition, cpc) -> int:
+        """Difficulty score from already extracted result fields"""
         # Prefer competition_index if available (0-100 scale)
-        competition_index = item.get('competition_index')
         if competition_index is not None:
             return competition_index
 
         # Fallback: use competition string and CPC
-        competition_str = (item.get('competition') or '').upper()
-        cpc = item.get('cpc') or 0
-        
-        # Map competition string to numeric value
-        competition_map = {
-            'HIGH': 75,
-            'MEDIUM': 50,
-            'LOW': 25
-        }
-        competition_value = competition_map.get(competition_str, 50)
+        competition_value = COMPETITION_SCORES.get((competition or '').upper(), 50)
         
         # Combine competition and CPC (capped at 100)
         # Higher competition and CPC = higher difficulty
-        difficulty = int(competition_value * 0.7 + min(cpc * 5, 30))
+        difficulty = int(competition_value * 0.7 + min((cpc or 0) * 5, 30))
         return min(difficulty, 100)
     
     def _extract_related(self, item: Dict) -> List[str]:
@@ -609,12 +835,38 @@ class KeywordResearcher:
         # Return empty list - related keywords would need separate API call
         return item.get('related_keywords', [])[:5]
     
-    def _calculate_relevance(self, item: Dict, original_topic: str) -> float:
-        """Calculate relevance score (0-100) based on multiple factors"""
+    def _calculate_relevance(
+        self,
+        item: Dict,
+        original_topic: str,
+        difficulty: Optional[int] = None
+    ) -> float:
+        """
+        Calculate relevance score (0-100) based on multiple factors
+
+        Args:
+            item: Keyword result from the API
+            original_topic: Topic the research was run for
+            difficulty: Precomputed _calculate_difficulty(item), if known
+        """
+        keyword, volume, competition, competition_index, cpc = _result_fields(item)
+        if difficulty is None:
+            difficulty = self._difficulty_from_fields(competition_index, competition, cpc)
+        return self._relevance_from_fields(
+            keyword or '', volume or 0, difficulty, original_topic.lower()
+        )
+
+    @staticmethod
+    def _relevance_from_fields(
+        keyword: str,
+        volume: int,
+        difficulty: int,
+        topic_lower: str
+    ) -> float:
+        """Relevance score from already extracted fields and lowercased topic"""
         score = 0.0
 
         # Factor 1: Search volume (30%)
-        volume = item.get('search_volume') or 0
         if volume > 10000:
             score += 30
         elif volume > 1000:
@@ -623,12 +875,10 @@ class KeywordResearcher:
             score += 10
         
         # Factor 2: Keyword difficulty (30% - inverse, easier = better)
-        difficulty = self._calculate_difficulty(item)
         score += (100 - difficulty) * 0.3
         
         # Factor 3: Topic relevance (40%)
-        keyword = item.get('keyword', '').lower()
-        topic_lower = original_topic.lower()
+        keyword = keyword.lower()
         
         # Exact match = highest relevance
         if keyword == topic_lower:
@@ -653,14 +903,13 @@ class KeywordResearcher:
         variations = self._generate_variations(topic)
         
         for i, variation in enumerate(variations[:limit]):
-            # Estimate metrics heuristically
-            estimated_volume = self._estimate_volume(variation)
-            estimated_difficulty = self._estimate_difficulty(variation)
+            # Estimate metrics heuristically (split each variation only once)
+            word_count = len(variation.split())
             
             keyword_data = KeywordData(
                 keyword=variation,
-                search_volume=estimated_volume,
-                keyword_difficulty=estimated_difficulty,
+                search_volume=self._volume_for_word_count(word_count),
+                keyword_difficulty=self._difficulty_for_word_count(word_count),
                 related_keywords=self._generate_related(variation, topic),
                 relevance_score=100 - (i * 10)  # Decrease by position
             )
@@ -670,30 +919,19 @@ class KeywordResearcher:
     
     def _generate_variations(self, topic: str) -> List[str]:
         """Generate keyword variations using common patterns"""
-        variations = [topic]  # Original topic first
-        
-        # Common modifiers
-        prefixes = ["best", "how to", "what is", "guide to", "tips for"]
-        suffixes = ["guide", "tips", "for beginners", "explained", "2024"]
-        
-        # Add prefix variations
-        for prefix in prefixes:
-            variations.append(f"{prefix} {topic}")
-        
-        # Add suffix variations
-        for suffix in suffixes:
-            variations.append(f"{topic} {suffix}")
-        
-        # Combined variations
-        variations.append(f"best {topic} tips")
-        variations.append(f"how to {topic}")
-        
-        return variations[:15]  # Return top 15 variations
-    
+        return [template.format(topic=topic) for template in VARIATION_TEMPLATES]
+
     def _estimate_volume(self, keyword: str) -> int:
         """Estimate search volume based on keyword characteristics"""
-        word_count = len(keyword.split())
-        
+        return self._volume_for_word_count(len(keyword.split()))
+    
+    def _estimate_difficulty(self, keyword: str) -> int:
+        """Estimate keyword difficulty based on characteristics"""
+        return self._difficulty_for_word_count(len(keyword.split()))
+    
+    @staticmethod
+    def _volume_for_word_count(word_count: int) -> int:
+        """Estimate search volume from the number of words in a keyword"""
         # Longer keywords typically have lower volume
         if word_count <= 2:
             return 5000
@@ -702,10 +940,9 @@ class KeywordResearcher:
         else:
             return 800
     
-    def _estimate_difficulty(self, keyword: str) -> int:
-        """Estimate keyword difficulty based on characteristics"""
-        word_count = len(keyword.split())
-        
+    @staticmethod
+    def _difficulty_for_word_count(word_count: int) -> int:
+        """Estimate keyword difficulty from the number of words in a keyword"""
         # Longer, more specific keywords are typically easier
         if word_count >= 4:
             return 35
@@ -716,54 +953,82 @@ class KeywordResearcher:
     
     def _generate_related(self, keyword: str, original: str) -> List[str]:
         """Generate related keyword suggestions"""
-        related = []
-        
         # Add question formats
-        related.append(f"what is {original}")
-        related.append(f"how to {original}")
-        related.append(f"why {original}")
+        related = [template.format(topic=original) for template in RELATED_TEMPLATES]
         
         # Add comparison format
         if " " in original:
             related.append(f"{original} vs")
         
-        return related[:5]
+        return related
 
 
-def format_output(keywords: List[KeywordData], format_type: str = "json") -> str:
-    """Format keyword research results"""
+def stream_output(keywords: List[KeywordData], format_type: str = "json") -> Iterator[str]:
+    """
+    Format keyword research results one keyword at a time.
+
+    Joining the chunks gives exactly the same text as format_output(), but
+    callers can write them out as they go instead of building the whole
+    document first.
+
+    Args:
+        keywords: KeywordData list to format
+        format_type: "json", "markdown" or "simple"
+
+    Yields:
+        Consecutive pieces of the formatted output
+    """
     if format_type == "json":
-        return json.dumps([kw.to_dict() for kw in keywords], indent=2)
+        if not keywords:
+            yield "[]"
+            return
+        
+        to_dict = KeywordData.to_dict
+        yield "["
+        for i, kw in enumerate(keywords):
+            # Serialize each row on its own, then indent it one level so the
+            # combined output matches dumping the whole list at once
+            if orjson is not None:
+                row = orjson.dumps(to_dict(kw), option=orjson.OPT_INDENT_2).decode('utf-8')
+            else:
+                row = json.dumps(to_dict(kw), indent=2)
+            yield ("\n  " if i == 0 else ",\n  ") + row.replace("\n", "\n  ")
+        yield "\n]"
     
     elif format_type == "markdown":
-        lines = ["# Keyword Research Results\n"]
-        
+        yield "# Keyword Research Results\n"
         for i, kw in enumerate(keywords, 1):
-            lines.append(f"## {i}. {kw.keyword}")
-            lines.append(f"- **Search Volume:** {kw.search_volume:,}")
-            lines.append(f"- **Difficulty:** {kw.keyword_difficulty}/100")
-            lines.append(f"- **Relevance:** {kw.relevance_score:.1f}/100")
-            
-            if kw.related_keywords:
-                lines.append(f"- **Related:** {', '.join(kw.related_keywords[:3])}")
-            lines.append("")
-        
-        return "\n".join(lines)
+            yield "\n" + MARKDOWN_ROW_TEMPLATE.format(
+                index=i,
+                keyword=kw.keyword,
+                volume=kw.search_volume,
+                difficulty=kw.keyword_difficulty,
+                relevance=kw.relevance_score,
+                related=(
+                    f"- **Related:** {', '.join(kw.related_keywords[:3])}\n"
+                    if kw.related_keywords else ""
+                )
+            )
     
     elif format_type == "simple":
-        lines = []
+        separator = ""
         for i, kw in enumerate(keywords, 1):
-            lines.append(
-                f"{i}. {kw.keyword} "
+            yield (
+                f"{separator}{i}. {kw.keyword} "
                 f"(Vol: {kw.search_volume:,}, Diff: {kw.keyword_difficulty}, "
                 f"Score: {kw.relevance_score:.0f})"
             )
-        return "\n".join(lines)
+            separator = "\n"
     
     else:
         raise ValueError(f"Unknown format: {format_type}")
 
 
+def format_output(keywords: List[KeywordData], format_type: str = "json") -> str:
+    """Format keyword research results"""
+    return "".join(stream_output(keywords, format_type))
+
+
 def main():
     """CLI interface for keyword research"""
     parser = argparse.ArgumentParser(
@@ -794,16 +1059,25 @@ def main():
         default="markdown",
         help="Output format (default: markdown)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch fresh results instead of using the 30-day keyword cache"
+    )
     
     args = parser.parse_args()
     
     # Initialize researcher with hybrid credential management
-    researcher = KeywordResearcher(api_key=args.api_key, interactive=args.interactive)
+    researcher = KeywordResearcher(
+        api_key=args.api_key,
+        interactive=args.interactive,
+        use_cache=not args.no_cache
+    )
     
     # Display API status
     if researcher.api_available:
         print("✓ Using DataForSEO API for research", file=sys.stderr)
-    else:
+    elif not researcher.api_key:
         print("⚠ API key not found. Using heuristic fallback.", file=sys.stderr)
         print("  Credential options:", file=sys.stderr)
         print("  1. Set DATAFORSEO_API_KEY environment variable", file=sys.stderr)
@@ -822,8 +1096,11 @@ def main():
             print("Error: No keywords found", file=sys.stderr)
             sys.exit(1)
         
-        # Output results
-        print(format_output(keywords, args.format))
+        # Output results as they are formatted
+        write = sys.stdout.write
+        for chunk in stream_output(keywords, args.format):
+            write(chunk)
+        write("\n")
         
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -9,6 +9,7 @@ Usage:
     python setup_credentials.py
 """
 
+import base64
 import json
 import os
 import sys
@@ -42,13 +43,13 @@ def setup_config():
         
         # Show current config (masked)
         try:
-            with open(config_file, 'r') as f:
+            with open(config_file, 'rb') as f:
                 current = json.load(f)
                 api_key = current.get('api_key', '')
                 if api_key:
                     masked = api_key[:10] + '...' if len(api_key) > 10 else '***'
                     print(f"Current API key: {masked}")
-        except:
+        except (OSError, ValueError, AttributeError, TypeError):
             pass
     
     print()
@@ -70,18 +71,19 @@ def setup_config():
     
     api_key = api_key.strip()
     
-    # Check if it's Base64 encoded (try to decode)
+    # Check if it's Base64 encoded (try to decode). Plain login:password
+    # can't be Base64 since ':' is outside the alphabet, so skip the attempt.
     is_base64 = False
-    try:
-        import base64
-        decoded_bytes = base64.b64decode(api_key, validate=True)
-        decoded = decoded_bytes.decode('utf-8')
-        if ':' in decoded:
-            print(f"✓ Detected Base64-encoded credentials")
-            print(f"  Decoded format: {decoded[:20]}...")
-            is_base64 = True
-    except Exception:
-        pass
+    if ':' not in api_key:
+        try:
+            decoded_bytes = base64.b64decode(api_key.encode('ascii'), validate=True)
+            decoded = decoded_bytes.decode('utf-8')
+            if ':' in decoded:
+                print(f"✓ Detected Base64-encoded credentials")
+                print(f"  Decoded format: {decoded[:20]}...")
+                is_base64 = True
+        except Exception:
+            pass
     
     # Validate format (should contain ':' or be valid Base64)
     if not is_base64 and ':' not in api_key:
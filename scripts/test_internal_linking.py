@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for internal_linking.py
+
+Usage:
+    python test_internal_linking.py
+
+    # The tests are also plain pytest tests
+    pytest test_internal_linking.py
+"""
+
+import sys
+
+from internal_linking import InternalLinkingAnalyzer, SiteContent
+
+
+BANNER = "=" * 60
+
+DRAFT = """# Writing Better Posts
+
+## Getting Started
+
+Good SEO basics make every post easier to find. {link}
+
+## Next Steps
+
+Keep the SEO basics in mind when you edit.
+"""
+
+
+def _seo_page(url: str) -> SiteContent:
+    return SiteContent(
+        url=url,
+        title="SEO Basics",
+        keywords=["seo basics"],
+        content_preview="An introduction to SEO basics.",
+        h2_headings=["What Is SEO"],
+    )
+
+
+def _suggested_urls(draft: str, page: SiteContent):
+    analyzer = InternalLinkingAnalyzer(min_relevance=0)
+    return [s.target_url for s in analyzer.suggest_links(draft, [page])]
+
+
+def test_unlinked_page_is_suggested():
+    """A page the draft does not link yet gets a suggestion"""
+    print("\n" + BANNER)
+    print("TEST: Unlinked Page Is Suggested")
+    print(BANNER)
+
+    urls = _suggested_urls(DRAFT.format(link=""), _seo_page("/seo-basics"))
+    assert urls == ["/seo-basics"], f"Expected one suggestion, got {urls}"
+    print("✓ Unlinked page suggested")
+
+
+def test_already_linked_page_is_skipped():
+    """Links match pages on their path, whatever the host or trailing slash"""
+    print("\n" + BANNER)
+    print("TEST: Already Linked Page Is Skipped")
+    print(BANNER)
+
+    cases = [
+        # (link in draft, page URL)
+        ("/seo-basics", "/seo-basics"),
+        ("/seo-basics/", "/seo-basics"),
+        ("https://example.com/seo-basics", "/seo-basics"),
+        ("https://example.com/seo-basics/", "/seo-basics"),
+        ("/seo-basics", "https://example.com/seo-basics"),
+        ("https://example.com/seo-basics#intro", "https://example.com/seo-basics/"),
+    ]
+    for link, page_url in cases:
+        draft = DRAFT.format(link=f"See the [guide]({link}).")
+        urls = _suggested_urls(draft, _seo_page(page_url))
+        assert urls == [], f"{link} should count as linking {page_url}, got {urls}"
+        print(f"✓ [guide]({link}) links {page_url}")
+
+    # A longer path sharing the prefix is a different page
+    draft = DRAFT.format(link="See the [guide](https://example.com/seo-basics-2).")
+    urls = _suggested_urls(draft, _seo_page("/seo-basics"))
+    assert urls == ["/seo-basics"], f"Expected one suggestion, got {urls}"
+    print("✓ /seo-basics-2 does not count as /seo-basics")
+
+
+TESTS = [
+    test_unlinked_page_is_suggested,
+    test_already_linked_page_is_skipped,
+]
+
+
+def main():
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ {test.__name__} FAILED: {e}")
+            failed += 1
+
+    print("\n" + BANNER)
+    print(f"RESULTS: {len(TESTS) - failed} passed, {failed} failed")
+    print(BANNER)
+    sys.exit(0 if failed == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,16 +17,41 @@ Usage:
     python test_keyword_research.py --real-api --api-key "login:password"
     python test_keyword_research.py --real-api --api-key "[base64-encoded]"  # Base64 format
     python test_keyword_research.py --real-api --interactive
+    python test_keyword_research.py --real-api --seed "deep work" --seed "habit stacking"
+    python test_keyword_research.py --real-api --no-cache  # skip cached results
     
     # Test specific component
     python test_keyword_research.py --test-parsing
+    
+    # Run the unit tests in parallel worker processes
+    python test_keyword_research.py --parallel
+    
+    # The unit tests are also plain pytest tests (real API test excluded)
+    pytest test_keyword_research.py
+    pytest -n auto test_keyword_research.py  # with pytest-xdist
+    pytest test_keyword_research.py -k "parse or difficulty"  # select by name
 """
 
 import argparse
+import contextlib
+import copy
+import dataclasses
+import functools
+import io
 import json
 import os
+import random
 import sys
-from typing import Dict, List
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+# Optional: parse JSON output with orjson, like keyword_research does
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import the module to test
 from keyword_research import (
@@ -36,11 +61,108 @@ from keyword_research import (
 )
 
 
+# Separator line for test section headers and the summary
+BANNER = "=" * 60
+
+
+@functools.lru_cache(maxsize=4)
+def _researcher(api_key: str) -> KeywordResearcher:
+    """Shared KeywordResearcher per key for tests that only call pure helpers"""
+    return KeywordResearcher(api_key=api_key, interactive=False)
+
+
+def _random_phrases(count: int, seed: int = 0) -> List[str]:
+    """Reproducible arbitrary text (words, whitespace, punctuation, unicode)"""
+    rng = random.Random(seed)
+    alphabet = "abcxyz é✓-?!  \t\n"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+
+# Mock API response matching DataForSEO v3 structure
+# Note: API returns status_code: 20000 at top level (not HTTP 200)
+MOCK_API_RESPONSE = {
+    "version": "0.1.20231115",
+    "status_code": 20000,
+    "status_message": "Ok.",
+    "time": 0.123,
+    "cost": 0.001,
+    "tasks_count": 1,
+    "tasks_error": 0,
+    "tasks": [{
+        "id": "test-task-123",
+        "status_code": 20000,
+        "status_message": "Ok.",
+        "time": 0.123,
+        "cost": 0.001,
+        "result_count": 3,
+        "path": ["v3", "keywords_data", "google_ads", "search_volume", "live"],
+        "data": {},
+        "result": [
+            {
+                "keyword": "healthy boundaries",
+                "search_volume": 12000,
+                "competition": "MEDIUM",
+                "competition_index": 45,
+                "cpc": 1.25,
+                "monthly_searches": [
+                    {"year": 2024, "month": 1, "search_volume": 11000},
+                    {"year": 2024, "month": 2, "search_volume": 12000}
+                ]
+            },
+            {
+                "keyword": "setting healthy boundaries",
+                "search_volume": 8500,
+                "competition": "LOW",
+                "competition_index": 30,
+                "cpc": 0.85
+            },
+            {
+                "keyword": "boundaries in relationships",
+                "search_volume": 15000,
+                "competition": "HIGH",
+                "competition_index": 75,
+                "cpc": 2.10
+            }
+        ]
+    }]
+}
+
+
+# Invalid status code (not 200 or 20000)
+INVALID_STATUS_RESPONSE = {"status_code": 400, "status_message": "Bad Request"}
+
+# Task-level error
+TASK_ERROR_RESPONSE = {
+    "status_code": 20000,
+    "tasks": [{
+        "status_code": 40001,
+        "status_message": "Task failed"
+    }]
+}
+
+# Successful task without results
+EMPTY_RESULT_RESPONSE = {
+    "status_code": 20000,
+    "tasks": [{
+        "status_code": 20000,
+        "result": []
+    }]
+}
+
+
+def _parse_unmodified(researcher: KeywordResearcher, response: dict, topic: str, limit: int):
+    """Parse a deep copy of a mock response, checking the parser leaves its input untouched"""
+    payload = copy.deepcopy(response)
+    keywords = researcher._parse_api_response(payload, topic, limit)
+    assert payload == response, "Parsing should not modify the API response"
+    return keywords
+
+
 def test_fallback_mode():
     """Test fallback mode (no API key)"""
-    print("=" * 60)
+    print(BANNER)
     print("TEST 1: Fallback Mode (No API Key)")
-    print("=" * 60)
+    print(BANNER)
     
     researcher = KeywordResearcher(api_key=None)
     
@@ -58,74 +180,23 @@ def test_fallback_mode():
         assert isinstance(kw.search_volume, int), "Search volume should be int"
         assert 0 <= kw.keyword_difficulty <= 100, "Difficulty should be 0-100"
         assert 0 <= kw.relevance_score <= 100, "Relevance should be 0-100"
-        assert isinstance(kw.related_keywords, list), "Related keywords should be list"
+        assert isinstance(kw.related_keywords, tuple), "Related keywords should be an immutable tuple"
     
     print(f"✓ Returned {len(keywords)} keywords")
     print(f"✓ First keyword: {keywords[0].keyword}")
     print(f"✓ Search volume: {keywords[0].search_volume:,}")
     print(f"✓ Difficulty: {keywords[0].keyword_difficulty}/100")
     print(f"✓ Relevance: {keywords[0].relevance_score:.1f}/100")
-    
-    return True
 
 
 def test_api_response_parsing():
     """Test API response parsing with mock data"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 2: API Response Parsing (Mock Data)")
-    print("=" * 60)
+    print(BANNER)
     
-    # Mock API response matching DataForSEO v3 structure
-    # Note: API returns status_code: 20000 at top level (not HTTP 200)
-    mock_response = {
-        "version": "0.1.20231115",
-        "status_code": 20000,
-        "status_message": "Ok.",
-        "time": 0.123,
-        "cost": 0.001,
-        "tasks_count": 1,
-        "tasks_error": 0,
-        "tasks": [{
-            "id": "test-task-123",
-            "status_code": 20000,
-            "status_message": "Ok.",
-            "time": 0.123,
-            "cost": 0.001,
-            "result_count": 3,
-            "path": ["v3", "keywords_data", "google_ads", "search_volume", "live"],
-            "data": {},
-            "result": [
-                {
-                    "keyword": "healthy boundaries",
-                    "search_volume": 12000,
-                    "competition": "MEDIUM",
-                    "competition_index": 45,
-                    "cpc": 1.25,
-                    "monthly_searches": [
-                        {"year": 2024, "month": 1, "search_volume": 11000},
-                        {"year": 2024, "month": 2, "search_volume": 12000}
-                    ]
-                },
-                {
-                    "keyword": "setting healthy boundaries",
-                    "search_volume": 8500,
-                    "competition": "LOW",
-                    "competition_index": 30,
-                    "cpc": 0.85
-                },
-                {
-                    "keyword": "boundaries in relationships",
-                    "search_volume": 15000,
-                    "competition": "HIGH",
-                    "competition_index": 75,
-                    "cpc": 2.10
-                }
-            ]
-        }]
-    }
-    
-    researcher = KeywordResearcher(api_key="test:key")
-    keywords = researcher._parse_api_response(mock_response, "healthy boundaries", limit=3)
+    researcher = _researcher("test:key")
+    keywords = _parse_unmodified(researcher, MOCK_API_RESPONSE, "healthy boundaries", limit=3)
     
     assert len(keywords) == 3, f"Expected 3 keywords, got {len(keywords)}"
     
@@ -146,17 +217,15 @@ def test_api_response_parsing():
     print(f"✓ Parsed {len(keywords)} keywords from mock response")
     print(f"✓ First keyword: {kw1.keyword} (Vol: {kw1.search_volume:,}, Diff: {kw1.keyword_difficulty})")
     print(f"✓ Relevance scores: {[f'{kw.relevance_score:.1f}' for kw in keywords]}")
-    
-    return True
 
 
 def test_difficulty_calculation():
     """Test difficulty calculation with various inputs"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 3: Difficulty Calculation")
-    print("=" * 60)
+    print(BANNER)
     
-    researcher = KeywordResearcher(api_key="test:key")
+    researcher = _researcher("test:key")
     
     # Test with competition_index
     item1 = {"competition_index": 65}
@@ -181,17 +250,15 @@ def test_difficulty_calculation():
     diff4 = researcher._calculate_difficulty(item4)
     assert 0 <= diff4 <= 100, f"Should handle missing competition, got {diff4}"
     print(f"✓ No competition data: {diff4}")
-    
-    return True
 
 
 def test_relevance_calculation():
     """Test relevance score calculation"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 4: Relevance Score Calculation")
-    print("=" * 60)
+    print(BANNER)
     
-    researcher = KeywordResearcher(api_key="test:key")
+    researcher = _researcher("test:key")
     
     # Exact match with high volume
     item1 = {
@@ -223,14 +290,22 @@ def test_relevance_calculation():
     assert rel3 < rel1, "Lower volume should score lower"
     print(f"✓ Low volume: {rel3:.1f}")
     
-    return True
+    # Numeric scoring on pre-extracted fields: only the topic match differs
+    topic = "healthy boundaries"
+    exact = researcher._relevance_from_fields("Healthy Boundaries", 15000, 40, topic)
+    partial = researcher._relevance_from_fields("setting healthy boundaries", 15000, 40, topic)
+    unrelated = researcher._relevance_from_fields("self care", 15000, 40, topic)
+    assert (exact, partial, unrelated) == (88.0, 78.0, 58.0), \
+        f"Unexpected field scores: {(exact, partial, unrelated)}"
+    assert rel1 == exact, "Item scoring should match field scoring"
+    print(f"✓ Field scoring (exact/partial/none): {exact:.0f}/{partial:.0f}/{unrelated:.0f}")
 
 
 def test_output_formats():
     """Test different output formats"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 5: Output Formats")
-    print("=" * 60)
+    print(BANNER)
     
     keywords = [
         KeywordData(
@@ -245,8 +320,9 @@ def test_output_formats():
     # Test JSON format
     json_output = format_output(keywords, "json")
     assert json_output, "JSON output should not be empty"
-    parsed = json.loads(json_output)
+    parsed = orjson.loads(json_output) if orjson is not None else json.loads(json_output)
     assert len(parsed) == 1, "Should contain one keyword"
+    assert parsed == [keywords[0].to_dict()], "JSON should round-trip to_dict()"
     print("✓ JSON format works")
     
     # Test markdown format
@@ -261,15 +337,13 @@ def test_output_formats():
     # Search volume may be formatted with commas (5,000) or without (5000)
     assert "5,000" in simple_output or "5000" in simple_output, "Should contain search volume"
     print("✓ Simple format works")
-    
-    return True
 
 
 def test_base64_credentials():
     """Test Base64 credential decoding"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 6: Base64 Credential Decoding")
-    print("=" * 60)
+    print(BANNER)
     
     from keyword_research import decode_base64_credentials
     
@@ -296,20 +370,37 @@ def test_base64_credentials():
     assert result == invalid, "Invalid Base64 should return as-is"
     print(f"✓ Invalid Base64 handled gracefully")
     
-    return True
-
-
-def test_real_api(api_key: str = None, interactive: bool = False):
+    # Plain text and non-alphabet input should skip the decode attempt
+    from unittest import mock
+    with mock.patch("keyword_research.base64.b64decode", wraps=base64.b64decode) as b64decode:
+        decode_base64_credentials(plain_text)
+        decode_base64_credentials(invalid)
+        decode_base64_credentials("abc*defg")  # right length, bad character
+        assert b64decode.call_count == 0, "Fast path should not call b64decode"
+        decode_base64_credentials(base64_encoded)
+        assert b64decode.call_count == 1, "Base64 input should still be decoded"
+    print("✓ Non-Base64 input skips decoding")
+
+
+def test_real_api(
+    api_key: str = None,
+    interactive: bool = False,
+    seeds: List[str] = None,
+    use_cache: bool = True
+):
     """
     Test with real API using hybrid credential management.
     
     Args:
         api_key: Explicitly provided API key (optional)
         interactive: Whether to prompt for credentials if not found
+        seeds: Topics to research (default: "healthy boundaries"). Several
+               seeds are requested concurrently over one pooled session.
+        use_cache: Allow cached results; pass False to force real API calls
     """
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 6: Real API Test (if credentials available)")
-    print("=" * 60)
+    print(BANNER)
     
     # Try to get credentials using hybrid approach
     from keyword_research import get_api_key
@@ -323,70 +414,92 @@ def test_real_api(api_key: str = None, interactive: bool = False):
         print("  2. Create ~/.dataforseo-skill/config.json")
         print("  3. Use --api-key 'login:password' argument")
         print("  4. Use --interactive flag to prompt")
-        return True
+        return
+    
+    seeds = seeds or ["healthy boundaries"]
     
     try:
-        researcher = KeywordResearcher(api_key=resolved_key, interactive=False)
+        researcher = KeywordResearcher(
+            api_key=resolved_key, interactive=False, use_cache=use_cache
+        )
         assert researcher.api_available, "API should be available"
         
         print(f"✓ Using API credentials (source: {'explicit' if api_key else 'auto-detected'})")
         print()
         
-        keywords = researcher.research_keywords("healthy boundaries", limit=3)
-        
-        if keywords:
-            print(f"✓ API returned {len(keywords)} keywords")
-            print()
-            for i, kw in enumerate(keywords, 1):
-                print(f"  {i}. {kw.keyword}")
-                print(f"     Volume: {kw.search_volume:,} | Difficulty: {kw.keyword_difficulty}/100 | Relevance: {kw.relevance_score:.1f}/100")
-        else:
-            print("⚠ API returned no keywords")
-            print("  Possible reasons:")
-            print("  - Rate limited")
-            print("  - Invalid API key")
-            print("  - Network error")
-            print("  - API service unavailable")
+        # Create the keep-alive session up front so worker threads share it
+        researcher._get_session()
+        with ThreadPoolExecutor(max_workers=min(len(seeds), 8)) as executor:
+            results = list(executor.map(
+                lambda seed: researcher.research_keywords(seed, limit=3), seeds
+            ))
         
-        return True
+        for seed, keywords in zip(seeds, results):
+            if len(seeds) > 1:
+                print(f"Seed: {seed}")
+            if keywords:
+                print(f"✓ API returned {len(keywords)} keywords")
+                print()
+                for i, kw in enumerate(keywords, 1):
+                    print(f"  {i}. {kw.keyword}")
+                    print(f"     Volume: {kw.search_volume:,} | Difficulty: {kw.keyword_difficulty}/100 | Relevance: {kw.relevance_score:.1f}/100")
+            else:
+                print("⚠ API returned no keywords")
+                print("  Possible reasons:")
+                print("  - Rate limited")
+                print("  - Invalid API key")
+                print("  - Network error")
+                print("  - API service unavailable")
         
     except Exception as e:
         print(f"⚠ API test failed: {e}")
         print("  This is OK if API key is invalid or rate limited")
-        import traceback
         print("\n  Full error:")
         traceback.print_exc()
-        return True
+        return
+    
+    # A repeat of the first seed should be served from the cache (outside the
+    # try above, so a cache mismatch fails instead of being reported as OK)
+    if use_cache and results[0]:
+        start = time.perf_counter()
+        repeat = researcher.research_keywords(seeds[0], limit=3)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        assert repeat == results[0], "Cached results should match the API results"
+        print(f"\n✓ Repeat lookup served from cache in {elapsed_ms:.1f} ms")
+
+
+# Real API calls are billable; keep pytest from collecting this (use --real-api)
+test_real_api.__test__ = False
 
 
 def test_generate_variations():
     """Test keyword variation generation"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 7: Keyword Variation Generation")
-    print("=" * 60)
+    print(BANNER)
     
-    researcher = KeywordResearcher(api_key="test:key")
+    researcher = _researcher("test:key")
     
     variations = researcher._generate_variations("healthy boundaries")
     
     assert len(variations) > 0, "Should generate variations"
     assert "healthy boundaries" in variations, "Should include original topic"
-    assert any("best" in v for v in variations), "Should include prefix variations"
-    assert any("guide" in v for v in variations), "Should include suffix variations"
+    # One pass over all variations collects every word for the pattern checks
+    words = set(" ".join(variations).split())
+    assert {"best", "how", "what"} <= words, "Should include prefix variations"
+    assert {"guide", "tips", "explained"} <= words, "Should include suffix variations"
     
     print(f"✓ Generated {len(variations)} variations")
     print(f"✓ Sample variations: {variations[:3]}")
-    
-    return True
 
 
 def test_estimate_volume():
     """Test search volume estimation"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 8: Search Volume Estimation")
-    print("=" * 60)
+    print(BANNER)
     
-    researcher = KeywordResearcher(api_key="test:key")
+    researcher = _researcher("test:key")
     
     # Test short keywords (higher volume)
     vol1 = researcher._estimate_volume("keyword")
@@ -404,16 +517,29 @@ def test_estimate_volume():
     assert vol4 == 800, "Long keywords should have lower volume"
     print(f"✓ Long keywords (4+ words): {vol4}")
     
-    return True
+    # Bulk check: estimates depend only on the word count, which is what the
+    # fallback research path computes once per variation
+    phrases = [" ".join(["word"] * n) for n in range(1, 9)] + ["  spaced   out\tphrase "]
+    for phrase in phrases:
+        expected = researcher._volume_for_word_count(len(phrase.split()))
+        assert researcher._estimate_volume(phrase) == expected, f"Mismatch for {phrase!r}"
+    print(f"✓ Word-count estimates agree for {len(phrases)} phrases")
+    
+    # Same rule over arbitrary text (mixed whitespace, punctuation, non-ASCII)
+    samples = _random_phrases(2000)
+    for phrase in samples:
+        expected = researcher._volume_for_word_count(len(phrase.split()))
+        assert researcher._estimate_volume(phrase) == expected, f"Mismatch for {phrase!r}"
+    print(f"✓ Word-count estimates agree for {len(samples)} random phrases")
 
 
 def test_estimate_difficulty():
     """Test keyword difficulty estimation"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 9: Keyword Difficulty Estimation")
-    print("=" * 60)
+    print(BANNER)
     
-    researcher = KeywordResearcher(api_key="test:key")
+    researcher = _researcher("test:key")
     
     # Test short keywords (harder)
     diff1 = researcher._estimate_difficulty("keyword")
@@ -431,16 +557,28 @@ def test_estimate_difficulty():
     assert diff4 == 35, "Long keywords should be easier"
     print(f"✓ Long keywords (4+ words): {diff4}/100")
     
-    return True
+    # Bulk check against the word-count rule used by fallback research
+    phrases = [" ".join(["word"] * n) for n in range(1, 9)] + ["  spaced   out\tphrase "]
+    for phrase in phrases:
+        expected = researcher._difficulty_for_word_count(len(phrase.split()))
+        assert researcher._estimate_difficulty(phrase) == expected, f"Mismatch for {phrase!r}"
+    print(f"✓ Word-count estimates agree for {len(phrases)} phrases")
+    
+    # Same rule over arbitrary text (mixed whitespace, punctuation, non-ASCII)
+    samples = _random_phrases(2000)
+    for phrase in samples:
+        expected = researcher._difficulty_for_word_count(len(phrase.split()))
+        assert researcher._estimate_difficulty(phrase) == expected, f"Mismatch for {phrase!r}"
+    print(f"✓ Word-count estimates agree for {len(samples)} random phrases")
 
 
 def test_generate_related():
     """Test related keyword generation"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 10: Related Keyword Generation")
-    print("=" * 60)
+    print(BANNER)
     
-    researcher = KeywordResearcher(api_key="test:key")
+    researcher = _researcher("test:key")
     
     related = researcher._generate_related("test keyword", "original topic")
     
@@ -450,32 +588,28 @@ def test_generate_related():
     
     print(f"✓ Generated {len(related)} related keywords")
     print(f"✓ Sample: {related[:2]}")
-    
-    return True
 
 
 def test_extract_related():
     """Test related keyword extraction from API response"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 11: Extract Related Keywords from API")
-    print("=" * 60)
+    print(BANNER)
     
-    researcher = KeywordResearcher(api_key="test:key")
+    researcher = _researcher("test:key")
     
     # Test with empty result (API doesn't provide related keywords)
     item = {"keyword": "test"}
     related = researcher._extract_related(item)
     assert isinstance(related, list), "Should return a list"
     print("✓ Returns empty list (API doesn't provide related keywords)")
-    
-    return True
 
 
 def test_get_api_key():
     """Test hybrid credential management"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 12: Hybrid Credential Management")
-    print("=" * 60)
+    print(BANNER)
     
     from keyword_research import get_api_key
     import os
@@ -496,15 +630,13 @@ def test_get_api_key():
     # Test with None (should try other methods)
     # This is tested indirectly through other tests
     print("✓ Credential resolution works")
-    
-    return True
 
 
 def test_keyword_data_to_dict():
     """Test KeywordData serialization"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 13: KeywordData Serialization")
-    print("=" * 60)
+    print(BANNER)
     
     kw = KeywordData(
         keyword="test",
@@ -519,96 +651,118 @@ def test_keyword_data_to_dict():
     assert data['keyword'] == "test", "Should contain keyword"
     assert data['search_volume'] == 1000, "Should contain search volume"
     assert data['relevance_score'] == 75.5, "Should contain relevance score"
+    assert kw.related_keywords == ("related",), "Related keywords should be stored as a tuple"
+    assert data['related_keywords'] == ["related"], "to_dict() should list related keywords"
     
     print("✓ to_dict() works correctly")
     print(f"✓ Dictionary keys: {list(data.keys())}")
     
-    return True
+    # Instances are shared by the result caches, so they must be immutable
+    try:
+        kw.relevance_score = 0.0
+        assert False, "KeywordData should be frozen"
+    except dataclasses.FrozenInstanceError:
+        pass
+    print("✓ KeywordData is immutable")
+    
+    # Slotted instances (Python 3.10+) carry no per-instance __dict__
+    if sys.version_info >= (3, 10):
+        assert not hasattr(kw, "__dict__"), "KeywordData should use __slots__"
+        print("✓ KeywordData uses __slots__")
 
 
 def test_error_handling():
     """Test error handling with invalid responses"""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 14: Error Handling")
-    print("=" * 60)
+    print(BANNER)
     
-    researcher = KeywordResearcher(api_key="test:key")
+    researcher = _researcher("test:key")
     
     # Test with invalid status code (not 200 or 20000)
-    invalid_response1 = {"status_code": 400, "status_message": "Bad Request"}
-    keywords1 = researcher._parse_api_response(invalid_response1, "test", 5)
+    keywords1 = _parse_unmodified(researcher, INVALID_STATUS_RESPONSE, "test", 5)
     assert len(keywords1) == 0, "Should return empty list for invalid status"
     print("✓ Handles invalid HTTP status")
     
     # Test with task error
-    invalid_response2 = {
-        "status_code": 20000,
-        "tasks": [{
-            "status_code": 40001,
-            "status_message": "Task failed"
-        }]
-    }
-    keywords2 = researcher._parse_api_response(invalid_response2, "test", 5)
+    keywords2 = _parse_unmodified(researcher, TASK_ERROR_RESPONSE, "test", 5)
     assert len(keywords2) == 0, "Should return empty list for task error"
     print("✓ Handles task-level errors")
     
     # Test with missing result
-    invalid_response3 = {
-        "status_code": 20000,
-        "tasks": [{
-            "status_code": 20000,
-            "result": []
-        }]
-    }
-    keywords3 = researcher._parse_api_response(invalid_response3, "test", 5)
+    keywords3 = _parse_unmodified(researcher, EMPTY_RESULT_RESPONSE, "test", 5)
     assert len(keywords3) == 0, "Should handle empty results"
     print("✓ Handles empty results")
-    
-    return True
 
 
-def run_all_tests():
-    """Run all tests"""
-    print("\n" + "=" * 60)
+TESTS = [
+    ("Fallback Mode", test_fallback_mode),
+    ("API Response Parsing", test_api_response_parsing),
+    ("Difficulty Calculation", test_difficulty_calculation),
+    ("Relevance Calculation", test_relevance_calculation),
+    ("Output Formats", test_output_formats),
+    ("Base64 Credentials", test_base64_credentials),
+    ("Keyword Variation Generation", test_generate_variations),
+    ("Search Volume Estimation", test_estimate_volume),
+    ("Keyword Difficulty Estimation", test_estimate_difficulty),
+    ("Related Keyword Generation", test_generate_related),
+    ("Extract Related Keywords", test_extract_related),
+    ("Hybrid Credential Management", test_get_api_key),
+    ("KeywordData Serialization", test_keyword_data_to_dict),
+    ("Error Handling", test_error_handling),
+]
+
+def _run_test(test: Tuple[str, Callable]) -> Tuple[str, bool]:
+    """Run one (name, function) test entry, reporting failures"""
+    test_name, test_func = test
+    try:
+        test_func()
+        return test_name, True
+    except AssertionError as e:
+        print(f"\n✗ {test_name} FAILED: {e}")
+    except Exception as e:
+        print(f"\n✗ {test_name} ERROR: {e}")
+        traceback.print_exc()
+    return test_name, False
+
+
+def _run_test_captured(test: Tuple[str, Callable]) -> Tuple[str, bool, str]:
+    """Run one test with its stdout buffered (one write per test, no interleaving)"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        test_name, ok = _run_test(test)
+    return test_name, ok, buffer.getvalue()
+
+
+def run_all_tests(parallel: bool = False):
+    """
+    Run all tests
+    
+    Args:
+        parallel: Run tests in worker processes (output is printed in order
+                  once each test finishes)
+    """
+    print("\n" + BANNER)
     print("RUNNING ALL TESTS")
-    print("=" * 60)
-    
-    tests = [
-        ("Fallback Mode", test_fallback_mode),
-        ("API Response Parsing", test_api_response_parsing),
-        ("Difficulty Calculation", test_difficulty_calculation),
-        ("Relevance Calculation", test_relevance_calculation),
-        ("Output Formats", test_output_formats),
-        ("Base64 Credentials", test_base64_credentials),
-        ("Keyword Variation Generation", test_generate_variations),
-        ("Search Volume Estimation", test_estimate_volume),
-        ("Keyword Difficulty Estimation", test_estimate_difficulty),
-        ("Related Keyword Generation", test_generate_related),
-        ("Extract Related Keywords", test_extract_related),
-        ("Hybrid Credential Management", test_get_api_key),
-        ("KeywordData Serialization", test_keyword_data_to_dict),
-        ("Error Handling", test_error_handling),
-    ]
+    print(BANNER)
     
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
-        try:
-            test_func()
-            passed += 1
-        except AssertionError as e:
-            print(f"\n✗ {test_name} FAILED: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"\n✗ {test_name} ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            failed += 1
-    
-    print("\n" + "=" * 60)
+    # Each test's output is buffered and written in one go, in test order
+    sys.stdout.flush()
+    with ProcessPoolExecutor() if parallel else contextlib.nullcontext() as executor:
+        run = executor.map if parallel else map
+        for _, ok, output in run(_run_test_captured, TESTS):
+            sys.stdout.write(output)
+            if ok:
+                passed += 1
+            else:
+                failed += 1
+    
+    print("\n" + BANNER)
     print(f"RESULTS: {passed} passed, {failed} failed")
-    print("=" * 60)
+    print(BANNER)
     
     return failed == 0
 
@@ -636,6 +790,17 @@ def main():
         action="store_true",
         help="Prompt for API credentials interactively if not found"
     )
+    parser.add_argument(
+        "--seed",
+        action="append",
+        dest="seeds",
+        help="Topic for the real API test; repeat to request several concurrently"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Make the real API test bypass cached keyword results"
+    )
     parser.add_argument(
         "--test-parsing",
         action="store_true",
@@ -646,6 +811,11 @@ def main():
         action="store_true",
         help="Test fallback mode only"
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run the unit tests in parallel worker processes"
+    )
     
     args = parser.parse_args()
     
@@ -658,13 +828,23 @@ def main():
         test_difficulty_calculation()
         test_relevance_calculation()
     elif args.real_api:
-        test_real_api(api_key=args.api_key, interactive=args.interactive)
+        test_real_api(
+            api_key=args.api_key,
+            interactive=args.interactive,
+            seeds=args.seeds,
+            use_cache=not args.no_cache
+        )
     else:
         # Run all tests
-        success = run_all_tests()
+        success = run_all_tests(parallel=args.parallel)
         # Optionally test real API if credentials available
         if os.getenv('DATAFORSEO_API_KEY') or args.api_key:
-            test_real_api(api_key=args.api_key, interactive=args.interactive)
+            test_real_api(
+                api_key=args.api_key,
+                interactive=args.interactive,
+                seeds=args.seeds,
+                use_cache=not args.no_cache
+            )
         
         sys.exit(0 if success else 1)
 
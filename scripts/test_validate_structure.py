@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for validate_structure.py
+
+Usage:
+    python test_validate_structure.py
+
+    # The tests are also plain pytest tests
+    pytest test_validate_structure.py
+"""
+
+import sys
+
+from validate_structure import scan_structure
+
+
+BANNER = "=" * 60
+
+
+def test_scan_structure_title():
+    """The title is the first H1 with text; empty H1 lines are skipped"""
+    print("\n" + BANNER)
+    print("TEST: scan_structure Title")
+    print(BANNER)
+
+    cases = [
+        # (content, expected title)
+        ("# Real Title here\n", "Real Title here"),
+        ("# \n# Real Title here\n", "Real Title here"),
+        ("#\t \n\n# Real Title here\n", "Real Title here"),
+        ("#\n#Not a heading\n# Real Title here\n", "Real Title here"),
+        ("## Section\n# Real Title here\n# Second H1\n", "Real Title here"),
+        ("# \n", ""),
+        ("No headings at all\n", ""),
+    ]
+    for content, expected in cases:
+        title = scan_structure(content)['title']
+        assert title == expected, f"{content!r}: expected {expected!r}, got {title!r}"
+        print(f"✓ {content!r} -> {title!r}")
+
+
+TESTS = [
+    test_scan_structure_title,
+]
+
+
+def main():
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ {test.__name__} FAILED: {e}")
+            failed += 1
+
+    print("\n" + BANNER)
+    print(f"RESULTS: {len(TESTS) - failed} passed, {failed} failed")
+    print(BANNER)
+    sys.exit(0 if failed == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()